@@ -0,0 +1,73 @@
+"""Shared tick_observation.jsonl scan for the inspection reports.
+
+Parses each line once into per-asset aware timestamps so several reports can
+run off a single pass over the file.
+"""
+
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    # Optional accelerator; decodes raw bytes without a str round-trip.
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+if sys.version_info >= (3, 11):
+    # 3.11+ accepts a trailing "Z" natively.
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value[-1:] == "Z" else value)
+
+
+def _parse_ts(value: object) -> datetime:
+    if not isinstance(value, str):
+        raise TypeError("ts_utc must be a string")
+    return _parse_ts_str(value)
+
+
+# Ticks for several assets commonly share one ts_utc string, so parsed values
+# are memoized (bounded).
+@lru_cache(maxsize=4096)
+def _parse_ts_str(value: str) -> datetime:
+    dt = _fromisoformat(value)
+    if dt.tzinfo is None:
+        raise ValueError("ts_utc missing timezone offset")
+    # Aware datetimes subtract and bucket consistently regardless of offset,
+    # so no astimezone() normalization is needed.
+    return dt
+
+
+def scan_ticks(path: str) -> dict[str, list[datetime]]:
+    """Return per-asset ts_utc values in file order.
+
+    Malformed lines are reported to stderr and skipped. OSError propagates so
+    callers can report unreadable files in their own wording.
+    """
+    ticks: dict[str, list[datetime]] = defaultdict(list)
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            # Both decoders tolerate surrounding whitespace, so only
+            # blank lines need skipping; isspace() avoids a copy per line.
+            if line.isspace():
+                continue
+            try:
+                rec = _loads(line)
+                asset = rec["asset"]
+                if not isinstance(asset, str):
+                    raise TypeError("asset must be a string")
+                ts = _parse_ts(rec["ts_utc"])
+            except Exception as exc:
+                print(
+                    f"WARNING: skipping malformed line {line_no}: {exc}",
+                    file=sys.stderr,
+                )
+                continue
+
+            ticks[asset].append(ts)
+    return ticks
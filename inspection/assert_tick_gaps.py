@@ -4,27 +4,29 @@ This is a descriptive inspection utility. It does not enforce correctness;
 it surfaces gap statistics so downstream aggregation decisions are informed.
 """
 
-import json
 import math
 import sys
-from collections import defaultdict
-from datetime import datetime, timezone
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from operator import sub
 
+from _common import scan_ticks
 
-def _parse_ts(value: object) -> datetime:
-    if not isinstance(value, str):
-        raise TypeError("ts_utc must be a string")
-    s = value[:-1] + "+00:00" if value.endswith("Z") else value
-    dt = datetime.fromisoformat(s)
-    if dt.tzinfo is None:
-        raise ValueError("ts_utc missing timezone offset")
-    return dt.astimezone(timezone.utc)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
 
 
-def _p95(values: list[float]) -> float:
-    values = sorted(values)
-    idx = max(0, int(math.ceil(0.95 * len(values))) - 1)
-    return values[idx]
+def _gap_stats(deltas_us: list[int], threshold: float) -> tuple[float, float, int]:
+    """Return (max, p95, count above threshold) in seconds from a single sort.
+
+    Gaps stay integer microseconds throughout; only the reported values and
+    the O(log n) threshold probes are converted to seconds.
+    """
+    deltas_us = sorted(deltas_us)
+    n = len(deltas_us)
+    idx = max(0, int(math.ceil(0.95 * n)) - 1)
+    above = n - bisect_right(deltas_us, threshold, key=lambda d: d / 1e6)
+    return deltas_us[-1] / 1e6, deltas_us[idx] / 1e6, above
 
 
 def main(argv: list[str]) -> int:
@@ -38,52 +40,33 @@ def main(argv: list[str]) -> int:
     path = argv[1]
     threshold = float(argv[2]) if len(argv) == 3 else 20.0
 
-    last_ts: dict[str, datetime] = {}
-    gaps: dict[str, list[float]] = defaultdict(list)
-    tick_counts: dict[str, int] = defaultdict(int)
-    valid = 0
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                    asset = rec["asset"]
-                    if not isinstance(asset, str):
-                        raise TypeError("asset must be a string")
-                    ts = _parse_ts(rec["ts_utc"])
-                except Exception as exc:
-                    print(
-                        f"WARNING: skipping malformed line {line_no}: {exc}",
-                        file=sys.stderr,
-                    )
-                    continue
-
-                prev = last_ts.get(asset)
-                if prev is not None:
-                    gaps[asset].append((ts - prev).total_seconds())
-                last_ts[asset] = ts
-                tick_counts[asset] += 1
-                valid += 1
+        ticks = scan_ticks(path)
     except OSError as exc:
         print(f"ERROR: cannot read file: {exc}", file=sys.stderr)
         return 1
 
-    if valid == 0:
+    if not ticks:
         print("ERROR: no valid tick records found", file=sys.stderr)
         return 1
 
-    for asset in sorted(tick_counts):
-        g = gaps.get(asset, [])
-        max_gap = max(g) if g else None
-        p95_gap = _p95(g) if g else None
-        over = sum(1 for x in g if x > threshold)
+    report(ticks, threshold)
+    return 0
+
+
+def report(ticks: dict[str, list[datetime]], threshold: float) -> None:
+    """Print gap statistics for per-asset timestamps from scan_ticks."""
+    for asset in sorted(ticks):
+        # Integer microseconds keep gap arithmetic exact (matches timedelta).
+        stamps = [(ts - _EPOCH) // _ONE_US for ts in ticks[asset]]
+        g = list(map(sub, stamps[1:], stamps))
+        if g:
+            max_gap, p95_gap, over = _gap_stats(g, threshold)
+        else:
+            max_gap, p95_gap, over = None, None, 0
 
         print(f"asset: {asset}")
-        print(f"  total_ticks: {tick_counts[asset]}")
+        print(f"  total_ticks: {len(stamps)}")
         print(
             f"  max_gap_s: {max_gap:.3f}" if max_gap is not None else "  max_gap_s: n/a"
         )
@@ -92,8 +75,6 @@ def main(argv: list[str]) -> int:
         )
         print(f"  gaps_over_{threshold:g}s: {over}")
 
-    return 0
-
 
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv))
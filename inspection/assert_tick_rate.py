@@ -4,21 +4,18 @@ Ticks are bucketed by (asset, minute), where the minute is ts_utc floored to
 the minute in UTC.
 """
 
-import json
 import math
 import sys
-from collections import defaultdict
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
 
+from _common import scan_ticks
 
-def _parse_ts(value: object) -> datetime:
-    if not isinstance(value, str):
-        raise TypeError("ts_utc must be a string")
-    s = value[:-1] + "+00:00" if value.endswith("Z") else value
-    dt = datetime.fromisoformat(s)
-    if dt.tzinfo is None:
-        raise ValueError("ts_utc missing timezone offset")
-    return dt.astimezone(timezone.utc)
+
+@lru_cache(maxsize=4096)
+def _floor_minute(ts: datetime) -> datetime:
+    return ts.replace(second=0, microsecond=0)
 
 
 def _p95_int(values: list[int]) -> int:
@@ -36,43 +33,25 @@ def main(argv: list[str]) -> int:
         return 1
 
     path = argv[1]
-    per_asset_minute: dict[str, dict[datetime, int]] = defaultdict(
-        lambda: defaultdict(int)
-    )
-    valid = 0
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                    asset = rec["asset"]
-                    if not isinstance(asset, str):
-                        raise TypeError("asset must be a string")
-                    ts = _parse_ts(rec["ts_utc"])
-                except Exception as exc:
-                    print(
-                        f"WARNING: skipping malformed line {line_no}: {exc}",
-                        file=sys.stderr,
-                    )
-                    continue
-
-                minute = ts.replace(second=0, microsecond=0)
-                per_asset_minute[asset][minute] += 1
-                valid += 1
+        ticks = scan_ticks(path)
     except OSError as exc:
         print(f"ERROR: cannot read file: {exc}", file=sys.stderr)
         return 1
 
-    if valid == 0:
+    if not ticks:
         print("ERROR: no valid tick records found", file=sys.stderr)
         return 1
 
-    for asset in sorted(per_asset_minute):
-        counts = list(per_asset_minute[asset].values())
+    report(ticks)
+    return 0
+
+
+def report(ticks: dict[str, list[datetime]]) -> None:
+    """Print per-minute tick rate statistics for timestamps from scan_ticks."""
+    for asset in sorted(ticks):
+        # Counter over a map counts in C.
+        counts = list(Counter(map(_floor_minute, ticks[asset])).values())
         minutes = len(counts)
         total = sum(counts)
         mean = total / minutes
@@ -84,8 +63,6 @@ def main(argv: list[str]) -> int:
         print(f"  max_ticks_per_minute: {max(counts)}")
         print(f"  p95_ticks_per_minute: {_p95_int(counts)}")
 
-    return 0
-
 
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv))
@@ -0,0 +1,43 @@
+"""Run the tick gap and tick rate reports from one scan of tick_observation.jsonl.
+
+Equivalent to running assert_tick_gaps.py and assert_tick_rate.py back to
+back, but the file is read and parsed only once.
+"""
+
+import sys
+
+import assert_tick_gaps
+import assert_tick_rate
+from _common import scan_ticks
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) not in (2, 3):
+        print(
+            "Usage: python inspection/report_ticks.py <tick_observation.jsonl> [threshold_seconds]",
+            file=sys.stderr,
+        )
+        return 1
+
+    path = argv[1]
+    threshold = float(argv[2]) if len(argv) == 3 else 20.0
+
+    try:
+        ticks = scan_ticks(path)
+    except OSError as exc:
+        print(f"ERROR: cannot read file: {exc}", file=sys.stderr)
+        return 1
+
+    if not ticks:
+        print("ERROR: no valid tick records found", file=sys.stderr)
+        return 1
+
+    print("== tick gaps ==")
+    assert_tick_gaps.report(ticks, threshold)
+    print("== tick rate ==")
+    assert_tick_rate.report(ticks)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
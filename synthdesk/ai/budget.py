@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -109,6 +110,8 @@ class MonthlyTokenBudget:
     - Resets automatically every ~30 days (rolling window from period start).
     - Persists to JSON so restarts don't bypass the fuse.
     - Exceeding the cap raises BudgetExceeded (a RuntimeError).
+    - Read-modify-write cycles are serialized so concurrent callers in one
+      process cannot lose updates.
     """
 
     def __init__(
@@ -127,6 +130,12 @@ class MonthlyTokenBudget:
         if self._reset_seconds <= 0:
             raise BudgetStorageError("reset_seconds must be > 0")
 
+        self._lock = threading.RLock()
+        # Precomputed write targets; the parent dir is created on first write.
+        self._final = str(self._path)
+        self._tmp = self._final + ".tmp"
+        self._parent_ready = False
+
     @property
     def path(self) -> Path:
         return self._path
@@ -141,7 +150,8 @@ class MonthlyTokenBudget:
         """
 
         now = float(time.time() if now_ts is None else now_ts)
-        self._write_state(_BudgetState(period_start_ts=now, tokens_used=0))
+        with self._lock:
+            self._write_state(_BudgetState(period_start_ts=now, tokens_used=0))
 
     def get_state(self, *, now_ts: Optional[float] = None) -> _BudgetState:
         """
@@ -149,11 +159,12 @@ class MonthlyTokenBudget:
         """
 
         now = float(time.time() if now_ts is None else now_ts)
-        state = self._read_state(now_ts=now)
-        reset_state = self._maybe_reset(state, now_ts=now)
-        if reset_state != state:
-            self._write_state(reset_state)
-        return reset_state
+        with self._lock:
+            state = self._read_state(now_ts=now)
+            reset_state = self._maybe_reset(state, now_ts=now)
+            if reset_state != state:
+                self._write_state(reset_state)
+            return reset_state
 
     def remaining_tokens(self, *, now_ts: Optional[float] = None) -> int:
         state = self.get_state(now_ts=now_ts)
@@ -175,18 +186,19 @@ class MonthlyTokenBudget:
             return self.get_state(now_ts=now_ts).tokens_used
 
         now = float(time.time() if now_ts is None else now_ts)
-        state = self._maybe_reset(self._read_state(now_ts=now), now_ts=now)
-        new_total = state.tokens_used + tokens
+        with self._lock:
+            state = self._maybe_reset(self._read_state(now_ts=now), now_ts=now)
+            new_total = state.tokens_used + tokens
 
-        if new_total > self._monthly_limit_tokens:
-            raise BudgetExceeded(
-                f"Monthly token budget exceeded: used={state.tokens_used}, "
-                f"adding={tokens}, limit={self._monthly_limit_tokens}"
-            )
+            if new_total > self._monthly_limit_tokens:
+                raise BudgetExceeded(
+                    f"Monthly token budget exceeded: used={state.tokens_used}, "
+                    f"adding={tokens}, limit={self._monthly_limit_tokens}"
+                )
 
-        new_state = _BudgetState(period_start_ts=state.period_start_ts, tokens_used=new_total)
-        self._write_state(new_state)
-        return new_total
+            new_state = _BudgetState(period_start_ts=state.period_start_ts, tokens_used=new_total)
+            self._write_state(new_state)
+            return new_total
 
     def _maybe_reset(self, state: _BudgetState, *, now_ts: float) -> _BudgetState:
         if (now_ts - state.period_start_ts) >= self._reset_seconds:
@@ -210,18 +222,20 @@ class MonthlyTokenBudget:
     def _write_state(self, state: _BudgetState) -> None:
         path = self._path
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            tmp = path.with_suffix(path.suffix + ".tmp")
-            with tmp.open("w", encoding="utf-8") as handle:
-                json.dump(state.to_json(), handle, indent=2)
+            if not self._parent_ready:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._parent_ready = True
+            with open(self._tmp, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps(state.to_json(), separators=(",", ":")))
                 handle.flush()
                 os.fsync(handle.fileno())
-            tmp.replace(path)
+            os.replace(self._tmp, self._final)
         except Exception as exc:  # noqa: BLE001 - normalize to BudgetStorageError
             raise BudgetStorageError(f"Failed to write budget state: {path}") from exc
 
 
 _DEFAULT_BUDGET: Optional[MonthlyTokenBudget] = None
+_DEFAULT_BUDGET_LOCK = threading.Lock()
 
 
 def get_default_budget() -> MonthlyTokenBudget:
@@ -230,9 +244,10 @@ def get_default_budget() -> MonthlyTokenBudget:
     """
 
     global _DEFAULT_BUDGET
-    if _DEFAULT_BUDGET is None:
-        _DEFAULT_BUDGET = MonthlyTokenBudget()
-    return _DEFAULT_BUDGET
+    with _DEFAULT_BUDGET_LOCK:
+        if _DEFAULT_BUDGET is None:
+            _DEFAULT_BUDGET = MonthlyTokenBudget()
+        return _DEFAULT_BUDGET
 
 
 def consume_tokens(tokens: int, *, now_ts: Optional[float] = None) -> int:
@@ -15,7 +15,10 @@ Intent:
 from __future__ import annotations
 
 import os
-from datetime import datetime, timezone
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from synthdesk.ai.budget import check_and_consume
 from synthdesk.ai.prompts import (
@@ -25,6 +28,7 @@ from synthdesk.ai.prompts import (
     REGIME_SUMMARY_PROMPT,
     REPAIR_PROMPT,
 )
+from synthdesk.utils.time import utc_day_str
 
 __all__ = [
     "suggest_patch",
@@ -32,11 +36,54 @@ __all__ = [
     "explain_invariant",
     "summarize_regime",
     "summarize_architecture_drift",
+    "run_prompts",
 ]
 
 # Single cheap + reliable default model for all calls.
 _MODEL = "gpt-4o-mini"
 
+# Upper bound on concurrent in-flight calls issued by run_prompts().
+_MAX_PARALLEL_PROMPTS = 4
+
+_PLACEHOLDER_RE = re.compile(r"<<(\w+)>>")
+
+# (literal fragments, placeholder names between them)
+_Template = Tuple[List[str], List[str]]
+
+
+def _compile_template(template: str) -> _Template:
+    """
+    Split a template into literal fragments and the placeholder names between them.
+    """
+
+    pieces = _PLACEHOLDER_RE.split(template)
+    return pieces[0::2], pieces[1::2]
+
+
+def _render(template: _Template, values: Dict[str, str]) -> str:
+    """
+    Substitute every placeholder in one pass (single join, no rescans).
+    """
+
+    parts, slots = template
+    out = [parts[0]]
+    for slot, part in zip(slots, parts[1:]):
+        out.append(values[slot])
+        out.append(part)
+    return "".join(out)
+
+
+# Lazily-constructed process-global client (re-created if the API key changes).
+_CLIENT: Optional[Any] = None
+_CLIENT_API_KEY: Optional[str] = None
+_CLIENT_LOCK = threading.Lock()
+
+_REPAIR_TEMPLATE = _compile_template(REPAIR_PROMPT)
+_LEDGER_TEMPLATE = _compile_template(LEDGER_PROMPT)
+_INVARIANT_TEMPLATE = _compile_template(INVARIANT_EXPLANATION_PROMPT)
+_REGIME_TEMPLATE = _compile_template(REGIME_SUMMARY_PROMPT)
+_ARCHITECTURE_DRIFT_TEMPLATE = _compile_template(ARCHITECTURE_DRIFT_PROMPT)
+
 
 def _estimate_tokens(text: str) -> int:
     """
@@ -49,20 +96,34 @@ def _estimate_tokens(text: str) -> int:
     return max(1, (len(text) // 4) + 200)
 
 
-def _call_openai(*, prompt: str, max_output_tokens: int) -> str:
+def _get_client(api_key: str) -> Any:
+    """
+    Return a shared OpenAI client so HTTP connection pools are reused across calls.
+    """
+
+    global _CLIENT, _CLIENT_API_KEY
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT_API_KEY != api_key:
+            try:
+                from openai import OpenAI  # keep OpenAI usage confined to this module
+            except Exception as exc:  # noqa: BLE001 - normalize to RuntimeError
+                raise RuntimeError("OpenAI client not available") from exc
+            _CLIENT = OpenAI(api_key=api_key)
+            _CLIENT_API_KEY = api_key
+        return _CLIENT
+
+
+def _call_openai(*, template: _Template, values: Dict[str, str], max_output_tokens: int) -> str:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("Missing OPENAI_API_KEY")
 
+    # sized from the prompt exactly as sent (rendered and stripped)
+    prompt = _render(template, values).strip()
     estimated_total = _estimate_tokens(prompt) + int(max_output_tokens)
     check_and_consume(estimated_total)
 
-    try:
-        from openai import OpenAI  # keep OpenAI usage confined to this module
-    except Exception as exc:  # noqa: BLE001 - normalize to RuntimeError
-        raise RuntimeError("OpenAI client not available") from exc
-
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
     try:
         resp = client.chat.completions.create(
             model=_MODEL,
@@ -89,12 +150,11 @@ def suggest_patch(traceback_text: str) -> str:
     Suggest fixes for a provided traceback (plain text only).
     """
 
-    prompt = (
-        REPAIR_PROMPT.replace("<<TRACEBACK>>", traceback_text)
-        .replace("<<CONTEXT>>", "")
-        .strip()
+    return _call_openai(
+        template=_REPAIR_TEMPLATE,
+        values={"TRACEBACK": traceback_text, "CONTEXT": ""},
+        max_output_tokens=800,
     )
-    return _call_openai(prompt=prompt, max_output_tokens=800)
 
 
 def synthesize_ledger(git_diff: str, notes: str, state: str) -> str:
@@ -102,14 +162,13 @@ def synthesize_ledger(git_diff: str, notes: str, state: str) -> str:
     Produce a factual daily ledger entry (Markdown only).
     """
 
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    date_str = utc_day_str()
     source = f"GIT DIFF:\n{git_diff}\n\nNOTES:\n{notes}\n\nSTATE:\n{state}".strip()
-    prompt = (
-        LEDGER_PROMPT.replace("<<DATE>>", date_str)
-        .replace("<<SOURCE>>", source)
-        .strip()
+    return _call_openai(
+        template=_LEDGER_TEMPLATE,
+        values={"DATE": date_str, "SOURCE": source},
+        max_output_tokens=900,
     )
-    return _call_openai(prompt=prompt, max_output_tokens=900)
 
 
 def explain_invariant(
@@ -121,15 +180,17 @@ def explain_invariant(
     Explain a violated invariant (Markdown only).
     """
 
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    prompt = (
-        INVARIANT_EXPLANATION_PROMPT.replace("<<EXPECTATION_ID>>", expectation_id)
-        .replace("<<EXPECTATION_TEXT>>", expectation_text)
-        .replace("<<VIOLATION_CONTEXT>>", violation_context)
-        .replace("<<DATE>>", date_str)
-        .strip()
+    date_str = utc_day_str()
+    return _call_openai(
+        template=_INVARIANT_TEMPLATE,
+        values={
+            "EXPECTATION_ID": expectation_id,
+            "EXPECTATION_TEXT": expectation_text,
+            "VIOLATION_CONTEXT": violation_context,
+            "DATE": date_str,
+        },
+        max_output_tokens=900,
     )
-    return _call_openai(prompt=prompt, max_output_tokens=900)
 
 
 def summarize_regime(
@@ -142,14 +203,16 @@ def summarize_regime(
     Produce a descriptive regime summary (Markdown only).
     """
 
-    prompt = (
-        REGIME_SUMMARY_PROMPT.replace("<<DATE>>", date)
-        .replace("<<WINDOW>>", window)
-        .replace("<<AGGREGATES>>", aggregates)
-        .replace("<<PRIOR_PERIOD_NOTES>>", prior_period_notes)
-        .strip()
+    return _call_openai(
+        template=_REGIME_TEMPLATE,
+        values={
+            "DATE": date,
+            "WINDOW": window,
+            "AGGREGATES": aggregates,
+            "PRIOR_PERIOD_NOTES": prior_period_notes,
+        },
+        max_output_tokens=900,
     )
-    return _call_openai(prompt=prompt, max_output_tokens=900)
 
 
 def summarize_architecture_drift(
@@ -162,11 +225,31 @@ def summarize_architecture_drift(
     Produce a descriptive architecture drift note (Markdown only).
     """
 
-    prompt = (
-        ARCHITECTURE_DRIFT_PROMPT.replace("<<WINDOW>>", window)
-        .replace("<<LEDGER_EXCERPTS>>", ledger_excerpts)
-        .replace("<<GIT_DIFF_SUMMARY>>", git_diff_summary)
-        .replace("<<INVARIANT_ACTIVITY>>", invariant_activity)
-        .strip()
+    return _call_openai(
+        template=_ARCHITECTURE_DRIFT_TEMPLATE,
+        values={
+            "WINDOW": window,
+            "LEDGER_EXCERPTS": ledger_excerpts,
+            "GIT_DIFF_SUMMARY": git_diff_summary,
+            "INVARIANT_ACTIVITY": invariant_activity,
+        },
+        max_output_tokens=900,
     )
-    return _call_openai(prompt=prompt, max_output_tokens=900)
+
+
+def run_prompts(jobs: Sequence[Callable[[], str]]) -> List[str]:
+    """
+    Run independent prompt jobs concurrently; results keep job order.
+
+    Each job is a zero-arg callable (e.g. `functools.partial(summarize_regime, ...)`).
+    Budget enforcement is unchanged: every job still pre-consumes its own
+    estimate before its network call. The first failing job's exception
+    (in job order) is re-raised.
+    """
+
+    if not jobs:
+        return []
+    workers = min(_MAX_PARALLEL_PROMPTS, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(job) for job in jobs]
+        return [future.result() for future in futures]
@@ -5,10 +5,31 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from synthdesk.listener.io.atomic import safe_append_csv
 from synthdesk.listener.version import VERSION
+from synthdesk.utils.time import utc_day_str
+
+_RUNS_BASE = Path(__file__).resolve().parents[2] / "runs" / VERSION
+
+# (YYYY-MM-DD, created day dir); mkdir only runs again on UTC day rollover.
+_DAY_DIR: Optional[Tuple[str, Path]] = None
+
+# ((timestamp, event_type), next dedupe suffix) for the last event written in
+# the current day dir. Collisions only happen within one timestamp, so only the
+# latest key is kept; any other key starts probing at 0.
+_NEXT_SUFFIX: Optional[Tuple[Tuple[str, str], int]] = None
+
+
+def _day_dir(day: str) -> Path:
+    global _DAY_DIR, _NEXT_SUFFIX
+    if _DAY_DIR is None or _DAY_DIR[0] != day:
+        day_dir = _RUNS_BASE / day
+        day_dir.mkdir(parents=True, exist_ok=True)
+        _DAY_DIR = (day, day_dir)
+        _NEXT_SUFFIX = None
+    return _DAY_DIR[1]
 
 
 def handle_regime_shift(event: Dict[str, Any], signals_dir: Path, logger=None) -> Path:
@@ -19,11 +40,10 @@ def handle_regime_shift(event: Dict[str, Any], signals_dir: Path, logger=None) -
         signals_dir: Kept for backward compatibility; ignored.
         logger: Optional logger for info/warnings.
     """
+    global _NEXT_SUFFIX
     print(event)
 
-    base = Path(__file__).resolve().parents[2] / "runs" / VERSION
-    day_dir = base / datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    day_dir.mkdir(parents=True, exist_ok=True)
+    day_dir = _day_dir(utc_day_str())
 
     event["version"] = VERSION
 
@@ -48,16 +68,31 @@ def handle_regime_shift(event: Dict[str, Any], signals_dir: Path, logger=None) -
 
     timestamp = event.get("timestamp") or datetime.now(timezone.utc).isoformat()
     event_type = event.get("event", "event")
-    filename = day_dir / f"{timestamp}-{event_type}.json"
 
-    # Avoid clobbering existing files if multiple events occur within the same second.
-    suffix = 1
-    while filename.exists():
-        filename = day_dir / f"{timestamp}-{event_type}_{suffix}.json"
-        suffix += 1
+    # Serialize once, before a filename is claimed, so a payload that cannot be
+    # encoded leaves no empty file behind.
+    data = json.dumps(event, indent=2).encode("utf-8")
 
-    with filename.open("w", encoding="utf-8") as handle:
-        json.dump(event, handle, indent=2)
+    # Avoid clobbering existing files if multiple events occur within the same second.
+    # Exclusive create claims the name; the counter skips already-used suffixes so
+    # bursts do not re-probe every earlier file.
+    key = (timestamp, event_type)
+    suffix = _NEXT_SUFFIX[1] if _NEXT_SUFFIX is not None and _NEXT_SUFFIX[0] == key else 0
+    while True:
+        if suffix:
+            filename = day_dir / f"{timestamp}-{event_type}_{suffix}.json"
+        else:
+            filename = day_dir / f"{timestamp}-{event_type}.json"
+        try:
+            handle = filename.open("xb")
+        except FileExistsError:
+            suffix += 1
+            continue
+        break
+    _NEXT_SUFFIX = (key, suffix + 1)
+
+    with handle:
+        handle.write(data)
 
     if logger:
         logger.info("Saved event %s to %s", event.get("event"), filename)
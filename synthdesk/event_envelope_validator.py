@@ -17,17 +17,32 @@ EXPECTED_FIELDS = (
     "payload",
 )
 
+# computed once; fields() reflection and set construction are not free per call
+_EXPECTED_SET = frozenset(EXPECTED_FIELDS)
+_ENVELOPE_FIELDS = frozenset(field.name for field in fields(EventEnvelope))
+
 
 def _validate_timestamp(value: object) -> None:
     if not isinstance(value, str):
         raise TypeError("timestamp must be a string")
     if "T" not in value:
         raise ValueError("timestamp must be ISO-8601 UTC string")
-    candidate = value[:-1] + "+00:00" if value.endswith("Z") else value
+    # explicit UTC suffixes need only a parse check, not an offset comparison
+    if value.endswith("Z"):
+        candidate = value[:-1] + "+00:00"
+        is_utc = True
+    elif value.endswith("+00:00"):
+        candidate = value
+        is_utc = True
+    else:
+        candidate = value
+        is_utc = False
     try:
         parsed = datetime.fromisoformat(candidate)
     except ValueError as exc:
         raise ValueError("timestamp must be ISO-8601 UTC string") from exc
+    if is_utc:
+        return
     if parsed.tzinfo is None:
         raise ValueError("timestamp must be ISO-8601 UTC string")
     if parsed.utcoffset() != timezone.utc.utcoffset(parsed):
@@ -37,8 +52,11 @@ def _validate_timestamp(value: object) -> None:
 def validate_event_envelope(value: object) -> None:
     """Validate a dict or EventEnvelope against the canonical schema."""
     if isinstance(value, EventEnvelope):
-        field_names = {field.name for field in fields(value)}
-        if field_names != set(EXPECTED_FIELDS):
+        if type(value) is EventEnvelope:
+            field_names = _ENVELOPE_FIELDS
+        else:
+            field_names = frozenset(field.name for field in fields(value))
+        if field_names != _EXPECTED_SET:
             raise ValueError("event envelope fields do not match canonical schema")
         _validate_timestamp(value.timestamp)
         return
@@ -47,7 +65,7 @@ def validate_event_envelope(value: object) -> None:
         for name in EXPECTED_FIELDS:
             if name not in value:
                 raise KeyError(f"missing required field: {name}")
-        extra = set(value.keys()) - set(EXPECTED_FIELDS)
+        extra = value.keys() - _EXPECTED_SET
         if extra:
             raise KeyError(f"unexpected field: {sorted(extra)[0]}")
         _validate_timestamp(value["timestamp"])
@@ -2,20 +2,66 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import threading
 from pathlib import Path
 
 from synthdesk.event_envelope import EventEnvelope
-from synthdesk.event_envelope_validator import validate_event_envelope
+from synthdesk.event_envelope_validator import EXPECTED_FIELDS, validate_event_envelope
+from synthdesk.spine_codec import encode_line
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+# one O_APPEND fd per resolved spine path, reused across appends; O_APPEND
+# keeps each single-write record from interleaving with other appenders.
+# Entries are (fd, st_dev, st_ino) so a renamed, rotated, or deleted spine is
+# noticed and reopened instead of written to the old inode.
+_FDS: dict[str, tuple[int, int, int]] = {}
+_FDS_LOCK = threading.Lock()
+
+
+def _spine_fd(path: str) -> int:
+    """Return an append fd for ``path``; call with ``_FDS_LOCK`` held."""
+    cached = _FDS.get(path)
+    if cached is not None:
+        fd, dev, ino = cached
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+        if st is not None and st.st_ino == ino and st.st_dev == dev:
+            return fd
+        del _FDS[path]
+        os.close(fd)
+    fd = os.open(path, _APPEND_FLAGS, 0o644)
+    st = os.fstat(fd)
+    _FDS[path] = (fd, st.st_dev, st.st_ino)
+    return fd
+
+
+def _close_spines() -> None:
+    with _FDS_LOCK:
+        for fd, _, _ in _FDS.values():
+            os.close(fd)
+        _FDS.clear()
+
+
+atexit.register(_close_spines)
 
 
 def append_event_spine(path: str | Path, event: dict | EventEnvelope) -> None:
     """Append a validated event to a JSONL spine file."""
     validate_event_envelope(event)
-    record = vars(event) if isinstance(event, EventEnvelope) else event
-    line = json.dumps(record, separators=(",", ":"))
-    path = Path(path)
-    with path.open("a", encoding="utf-8", buffering=1) as handle:
-        handle.write(line)
-        handle.write("\n")
-        handle.flush()
+    if isinstance(event, EventEnvelope):
+        # slotted envelopes have no __dict__; asdict() would deep-copy payload
+        record = {name: getattr(event, name) for name in EXPECTED_FIELDS}
+    else:
+        record = event
+    line = encode_line(record)
+    path = os.path.realpath(path)
+    with _FDS_LOCK:
+        fd = _spine_fd(path)
+        written = os.write(fd, line)
+        while written < len(line):
+            written += os.write(fd, line[written:])
@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-Event = Dict[str, Any]
-
+from synthdesk.utils.time import utc_now
 
-def _timestamp(ts: Optional[str]) -> str:
-    return ts or datetime.now(timezone.utc).isoformat()
+Event = Dict[str, Any]
 
 
 def detect_breakout(
@@ -23,7 +20,7 @@ def detect_breakout(
 
     breakout_threshold is interpreted as a fractional distance from the mean.
     """
-    ts = _timestamp(timestamp)
+    ts = timestamp or utc_now()
     if rolling_mean == 0:
         return None
     deviation = price - rolling_mean
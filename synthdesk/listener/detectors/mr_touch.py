@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from synthdesk.utils.time import utc_now
+
 from ..transforms import mean_reversion_bands
 
 Event = Dict[str, Any]
 
 
-def _timestamp(ts: Optional[str]) -> str:
-    return ts or datetime.now(timezone.utc).isoformat()
-
-
 def detect_mr_touch(
     pair: str,
     price: float,
@@ -22,7 +19,7 @@ def detect_mr_touch(
     timestamp: Optional[str] = None,
 ) -> Optional[Event]:
     """Detect when price touches mean-reversion bands."""
-    ts = _timestamp(timestamp)
+    ts = timestamp or utc_now()
     lower, upper = mean_reversion_bands(rolling_mean, band_width)
     if lower <= price <= upper:
         return None
@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-Event = Dict[str, Any]
-
+from synthdesk.utils.time import utc_now
 
-def _timestamp(ts: Optional[str]) -> str:
-    return ts or datetime.now(timezone.utc).isoformat()
+Event = Dict[str, Any]
 
 
 def detect_vol_spike(
@@ -19,7 +16,7 @@ def detect_vol_spike(
     timestamp: Optional[str] = None,
 ) -> Optional[Event]:
     """Detect when short-term volatility exceeds the long-term baseline."""
-    ts = _timestamp(timestamp)
+    ts = timestamp or utc_now()
     if long_vol <= 0:
         return None
     if short_vol <= long_vol:
@@ -1,30 +1,102 @@
 import csv
+import io
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+# O_APPEND keeps concurrent appenders from interleaving mid-record.
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+_TRUNC_FLAGS = os.O_WRONLY | os.O_TRUNC | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+_EXCL_FLAGS = os.O_WRONLY | os.O_EXCL | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
 
-def atomic_write_json(path: Path, obj: Any) -> None:
+# directories this process has already created; a hit skips the mkdir syscalls
+_ENSURED_DIRS: set[Path] = set()
+
+
+def ensure_dir(directory: Path) -> None:
+    """Create `directory` (and parents) once per process."""
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+def _open_append(path: Path) -> int:
+    ensure_dir(path.parent)
+    try:
+        return os.open(path, _APPEND_FLAGS, 0o644)
+    except FileNotFoundError:
+        # directory removed after it was cached: recreate it once
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, _APPEND_FLAGS, 0o644)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write a record with one write() syscall, finishing any short write."""
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def create_exclusive_bytes(path: Path, data: bytes, *, durable: bool = False) -> None:
+    """Create `path` holding `data`; raises FileExistsError if it exists.
+
+    With `durable`, the data is fsynced before the file is closed.
+    """
+    fd = os.open(path, _EXCL_FLAGS, 0o666)
+    try:
+        _write_all(fd, data)
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` transactionally (tmp + fsync + replace)."""
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as fh:
-        json.dump(obj, fh, indent=2)
-        fh.flush()
-        os.fsync(fh.fileno())
-    tmp.replace(path)
+    fd = os.open(tmp, _TRUNC_FLAGS, 0o644)
+    try:
+        _write_all(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def atomic_write_json(path: Path, obj: Any) -> None:
+    atomic_write_bytes(path, json.dumps(obj, indent=2).encode("utf-8"))
+
+
+def _text_record(line: str) -> bytes:
+    if not line.endswith("\n"):
+        line += "\n"
+    return line.encode("utf-8")
+
+
+def _csv_records(rows, header=None) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(header)
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def _csv_record(row, header=None) -> bytes:
+    return _csv_records((row,), header)
 
 
 def safe_append_text(path: Path, line: str) -> None:
     """
     Append a single line of text to a log file, flushing to disk.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(line)
-        if not line.endswith("\n"):
-            fh.write("\n")
-        fh.flush()
-        os.fsync(fh.fileno())
+    fd = _open_append(path)
+    try:
+        _write_all(fd, _text_record(line))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def safe_append_csv(path: Path, row, header=None) -> None:
@@ -32,12 +104,45 @@ def safe_append_csv(path: Path, row, header=None) -> None:
     Append a single CSV row, writing a header if the file is new.
     `row` and `header` are sequences.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    exists = path.exists()
-    with path.open("a", encoding="utf-8", newline="") as fh:
-        writer = csv.writer(fh)
-        if (not exists) and header:
-            writer.writerow(header)
-        writer.writerow(row)
-        fh.flush()
-        os.fsync(fh.fileno())
+    fd = _open_append(path)
+    try:
+        # an empty file is new regardless of who created it; header and row
+        # go out in a single write syscall
+        new = bool(header) and os.fstat(fd).st_size == 0
+        _write_all(fd, _csv_record(row, header if new else None))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SafeAppender:
+    """
+    Long-lived append handle with the same per-write flush + fsync guarantee
+    as `safe_append_*`, minus the open/close per record.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd = _open_append(path)
+        self._empty = os.fstat(self._fd).st_size == 0
+
+    def append_text(self, line: str) -> None:
+        self._append(_text_record(line))
+
+    def append_csv(self, row, header=None) -> None:
+        self._append(_csv_record(row, header if self._empty else None))
+
+    def append_csv_rows(self, rows, header=None) -> None:
+        """Append several rows with one write + fsync (no-op for no rows)."""
+        if rows:
+            self._append(_csv_records(rows, header if self._empty else None))
+
+    def _append(self, data: bytes) -> None:
+        _write_all(self._fd, data)
+        os.fsync(self._fd)
+        self._empty = False
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,92 @@
+"""
+write-back ring: coalesces small appends into batched writes.
+
+Only for surfaces that are not required to fsync on each write; fsynced
+append logs go through `atomic.safe_append_*`.
+"""
+
+import atexit
+import os
+import threading
+from pathlib import Path
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+class WriteBackRing:
+    """Buffer appends to one file and write them out in batches.
+
+    The buffer is written when it reaches `max_bytes` or `max_records`, every
+    `flush_interval` seconds from a background thread, and on close() (also
+    registered with atexit).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 1 << 20,
+        max_records: int = 4096,
+        flush_interval: float = 0.1,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self._buf = bytearray()
+        self._records = 0
+        self._fd = os.open(self.path, _APPEND_FLAGS, 0o644)
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(flush_interval,),
+            name=f"wb-ring:{self.path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append(self, data: bytes) -> None:
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError(f"write-back ring for {self.path} is closed")
+            self._buf += data
+            self._records += 1
+            if len(self._buf) >= self.max_bytes or self._records >= self.max_records:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+
+    def _flush_locked(self) -> None:
+        if not self._buf:
+            return
+        written = 0
+        try:
+            with memoryview(self._buf) as view:
+                while written < len(view):
+                    written += os.write(self._fd, view[written:])
+        finally:
+            # drop only what reached the file so a retry cannot duplicate it
+            del self._buf[:written]
+            if not self._buf:
+                self._records = 0
+
+    def _run(self, flush_interval: float) -> None:
+        while not self._closed.wait(flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                # kept buffered; retried next interval, surfaced by close()
+                pass
@@ -2,49 +2,143 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import math
+import threading
+import time
 from collections import deque
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException, HTTPSConnection
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.parse import quote
 
-from synthdesk.listener.io.atomic import atomic_write_json, safe_append_csv, safe_append_text
-from synthdesk.listener.transforms import log_return, log_returns, price_range, rolling_corr, rolling_mean, rolling_std, slope, zscore
+from synthdesk.listener.io.atomic import SafeAppender, atomic_write_bytes, atomic_write_json, safe_append_text
+from synthdesk.listener.io.wb_ring import WriteBackRing
+from synthdesk.listener.transforms import rolling_corr, zscore
 from synthdesk.listener.version import VERSION
-
-API_URL = "https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
+from synthdesk.spine_codec import decode, encode_line
+from synthdesk.utils.time import utc_day_str, utc_now
+
+API_HOST = "api.binance.com"
+TICKER_PATH = "/api/v3/ticker/price"
+
+# one keep-alive connection per fetching thread (no handshake per request;
+# http.client connections cannot be shared across threads)
+_LOCAL = threading.local()
+
+# per-pair fallback fetches run on a small persistent pool so each worker
+# keeps its own keep-alive connection across cycles
+_MAX_PARALLEL_FETCHES = 4
+_FETCH_POOL: Optional[ThreadPoolExecutor] = None
+_FETCH_POOL_LOCK = threading.Lock()
+
+# sequence_meta.json is rewritten at most this often (or every N ticks);
+# reload after a crash may rewind tick ids by the unflushed ticks
+SEQ_META_FLUSH_SECONDS = 0.25
+SEQ_META_FLUSH_TICKS = 256
+
+# tick_log.csv layout, built once rather than per tick
+TICK_LOG_METRICS = (
+    "log_return",
+    "rolling_mean",
+    "rolling_std",
+    "zscore",
+    "slope",
+    "range",
+    "rolling_correlation",
+)
+TICK_LOG_HEADER = ("timestamp", "pair", "price", *TICK_LOG_METRICS)
+_tick_log_metrics = itemgetter(*TICK_LOG_METRICS)
+
+
+def _get_json(path: str) -> Any:
+    """GET `path` from the Binance API over this thread's keep-alive connection."""
+    for attempt in (1, 2):
+        conn = getattr(_LOCAL, "conn", None)
+        if conn is None:
+            conn = _LOCAL.conn = HTTPSConnection(API_HOST, timeout=10)
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, HTTPException):
+            conn.close()
+            _LOCAL.conn = None
+            if attempt == 2:
+                raise
+            # the server may have dropped an idle keep-alive; GET is safe to retry
+            continue
+        if response.status != 200:
+            raise HTTPException(f"HTTP {response.status} for {path}: {body[:200]!r}")
+        return decode(body)
+
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    global _FETCH_POOL
+    with _FETCH_POOL_LOCK:
+        if _FETCH_POOL is None:
+            _FETCH_POOL = ThreadPoolExecutor(
+                max_workers=_MAX_PARALLEL_FETCHES, thread_name_prefix="fetch_price"
+            )
+        return _FETCH_POOL
 
 
 def fetch_price(pair: str, logger=None) -> Optional[float]:
     """Fetch latest price for a trading pair from Binance public API."""
-    url = API_URL.format(symbol=pair)
     try:
-        with urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            price_str = data.get("price") if isinstance(data, dict) else None
-            if price_str is None:
-                if logger:
-                    logger.warning("Unexpected response for %s: %s", pair, data)
-                return None
-            return float(price_str)
-    except (URLError, ValueError) as exc:
+        data = _get_json(f"{TICKER_PATH}?symbol={quote(pair)}")
+        price_str = data.get("price") if isinstance(data, dict) else None
+        if price_str is None:
+            if logger:
+                logger.warning("Unexpected response for %s: %s", pair, data)
+            return None
+        return float(price_str)
+    except (OSError, HTTPException, ValueError) as exc:
         if logger:
             logger.error("Failed to fetch price for %s: %s", pair, exc)
         return None
 
 
 def fetch_prices(pairs: Iterable[str], logger=None) -> Dict[str, float]:
-    """Fetch prices for multiple pairs, skipping failures."""
+    """Fetch prices for multiple pairs, skipping failures.
+
+    All pairs are requested in one call; if that call fails (Binance rejects
+    the whole batch when any symbol is invalid), pairs are fetched
+    concurrently one request each. Results keep the order of `pairs`.
+    """
+    pairs = list(pairs)
+    if len(pairs) > 1:
+        symbols = quote("[" + ",".join(f'"{pair}"' for pair in pairs) + "]", safe="")
+        try:
+            data = _get_json(f"{TICKER_PATH}?symbols={symbols}")
+            by_symbol = {item["symbol"]: float(item["price"]) for item in data}
+        except (OSError, HTTPException, ValueError, KeyError, TypeError) as exc:
+            if logger:
+                logger.warning("Batched price fetch failed, fetching per pair: %s", exc)
+        else:
+            return {pair: by_symbol[pair] for pair in pairs if pair in by_symbol}
+
+    if len(pairs) > 1:
+        fetched = list(_fetch_pool().map(lambda pair: fetch_price(pair, logger=logger), pairs))
+    else:
+        fetched = [fetch_price(pair, logger=logger) for pair in pairs]
+
     prices: Dict[str, float] = {}
-    for pair in pairs:
-        price = fetch_price(pair, logger=logger)
+    for pair, price in zip(pairs, fetched):
         if price is not None:
             prices[pair] = price
     return prices
 
 
+# PriceTracker re-sums its returns exactly once the window's spread (M2) falls
+# below this fraction of the squared deviations added since the last re-sum,
+# which bounds the relative error of rolling_std near 1e-10.
+_RESUM_SPREAD_RATIO = 1e-6
+
+
 class PriceTracker:
     """Track rolling metrics for a single pair."""
 
@@ -53,7 +147,31 @@ class PriceTracker:
         self.window = window
         self.long_window = window
         self.short_window = min(max(5, window // 3), window)
+        self._reset()
+
+    def _reset(self) -> None:
+        window = self.long_window
         self.prices: deque[float] = deque(maxlen=window)
+        # log return per consecutive price pair (None where a price is not
+        # positive), kept aligned with `prices` so each tick adds one log()
+        self.returns: deque[Optional[float]] = deque(maxlen=max(window - 1, 0))
+        self._invalid_returns = 0
+        # running sums of (return - shift) over the valid returns: O(1) mean/std
+        # per tick. The shift is the window mean as of the last exact re-sum,
+        # so the sums stay small even when the mean dwarfs the spread (a
+        # trending, low-noise series). Re-summed once per window so add/drop
+        # rounding cannot accumulate, and early when the spread collapses far
+        # below what has been added since (see update()).
+        self._ret_shift = 0.0
+        self._ret_sum = 0.0
+        self._ret_sum_sq = 0.0
+        self._ret_sq_added = 0.0
+        self._zero_returns = 0
+        self._until_resum = window
+        # monotonic (index, price) deques: O(1) amortized window max/min
+        self._n_seen = 0
+        self._max_q: deque[tuple[int, float]] = deque()
+        self._min_q: deque[tuple[int, float]] = deque()
 
     def save_state(self, path: Path) -> None:
         data = {
@@ -62,21 +180,94 @@ class PriceTracker:
             "short_window": self.short_window,
             "long_window": self.long_window,
         }
-        atomic_write_json(path, data)
+        # rewritten every tick: compact codec bytes, still tmp + fsync + replace
+        atomic_write_bytes(path, encode_line(data))
 
     def load_state(self, path: Path) -> None:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        with path.open("rb") as f:
+            data = decode(f.read())
         # restore rolling window using long_window as maxlen
-        self.prices = deque(data["prices"], maxlen=self.long_window)
+        self._reset()
+        for price in data["prices"]:
+            self._append(price)
+
+    def _append(self, price: float) -> None:
+        prices = self.prices
+        if prices:
+            prev = prices[-1]
+            returns = self.returns
+            if returns and len(returns) == returns.maxlen:
+                dropped = returns.popleft()
+                if dropped is None:
+                    self._invalid_returns -= 1
+                else:
+                    d = dropped - self._ret_shift
+                    self._ret_sum -= d
+                    self._ret_sum_sq -= d * d
+                    if dropped == 0.0:
+                        self._zero_returns -= 1
+            if prev > 0 and price > 0:
+                r = math.log(price / prev)
+                if len(returns) == self._invalid_returns:
+                    # no valid return left in the window: anchor on this one
+                    self._ret_shift = r
+                    self._ret_sum = 0.0
+                    self._ret_sum_sq = 0.0
+                    self._ret_sq_added = 0.0
+                returns.append(r)
+                d = r - self._ret_shift
+                self._ret_sum += d
+                self._ret_sum_sq += d * d
+                self._ret_sq_added += d * d
+                if r == 0.0:
+                    self._zero_returns += 1
+            else:
+                returns.append(None)
+                self._invalid_returns += 1
+            self._until_resum -= 1
+            if self._until_resum <= 0:
+                self._resum_returns()
+        prices.append(price)
+
+        idx = self._n_seen
+        self._n_seen = idx + 1
+        expired = idx - self.long_window
+        max_q = self._max_q
+        while max_q and max_q[-1][1] <= price:
+            max_q.pop()
+        max_q.append((idx, price))
+        if max_q[0][0] <= expired:
+            max_q.popleft()
+        min_q = self._min_q
+        while min_q and min_q[-1][1] >= price:
+            min_q.pop()
+        min_q.append((idx, price))
+        if min_q[0][0] <= expired:
+            min_q.popleft()
+
+    def _resum_returns(self) -> None:
+        valid = [r for r in self.returns if r is not None]
+        shift = sum(valid) / len(valid) if valid else 0.0
+        devs = [r - shift for r in valid]
+        self._ret_shift = shift
+        self._ret_sum = sum(devs)
+        self._ret_sum_sq = self._ret_sq_added = sum([d * d for d in devs])
+        self._until_resum = self.long_window
+
+    def recent_returns(self, n_pairs: int) -> List[float]:
+        """Return the valid log returns among the last `n_pairs` price pairs."""
+        returns = self.returns
+        start = max(len(returns) - n_pairs, 0)
+        return [r for r in islice(returns, start, None) if r is not None]
 
     def update(self, price: float) -> Dict[str, float]:
-        self.prices.append(price)
-        history: List[float] = list(self.prices)
-        if not history:
+        self._append(price)
+        prices = self.prices
+        n_prices = len(prices)
+        if not n_prices:
             return {}
 
-        if len(history) < 2:
+        if n_prices < 2:
             return {
                 "log_return": 0.0,
                 "rolling_mean": 0.0,
@@ -86,21 +277,31 @@ class PriceTracker:
                 "range": 0.0,
             }
 
-        try:
-            last_lr = log_return(history[-2], history[-1])
-        except ValueError:
+        last_lr = self.returns[-1]
+        if last_lr is None:
             last_lr = 0.0
 
-        returns_window = min(self.long_window - 1, len(history) - 1)
-        returns = log_returns(history, returns_window)
-
-        mean = rolling_mean(returns, len(returns)) if returns else 0.0
-        std = rolling_std(returns, len(returns)) if returns else 0.0
+        n = len(self.returns) - self._invalid_returns
+        if n == self._zero_returns:
+            # flat window (or no valid returns): exact zeros, not rounding residue
+            mean = 0.0
+            std = 0.0
+        else:
+            shifted_mean = self._ret_sum / n
+            m2 = self._ret_sum_sq - self._ret_sum * shifted_mean
+            if m2 < self._ret_sq_added * _RESUM_SPREAD_RATIO:
+                # the rounding error left by dropped returns scales with what was
+                # added, not with what remains: re-sum before it dominates
+                self._resum_returns()
+                shifted_mean = self._ret_sum / n
+                m2 = self._ret_sum_sq - self._ret_sum * shifted_mean
+            mean = self._ret_shift + shifted_mean
+            variance = m2 / (n - 1) if n >= 2 else 0.0
+            std = math.sqrt(variance) if variance > 0 else 0.0
         z = zscore(last_lr, mean, std)
 
-        n_slope = min(self.long_window - 1, len(history) - 1)
-        current_slope = slope(history, n_slope) if n_slope > 0 else 0.0
-        current_range = price_range(history, min(self.long_window, len(history)))
+        current_slope = (prices[-1] - prices[0]) / (n_prices - 1)
+        current_range = self._max_q[0][1] - self._min_q[0][1]
 
         return {
             "log_return": last_lr,
@@ -133,11 +334,24 @@ class PriceListener:
         self.tick_seq = 0
         if self.seq_meta_path.exists():
             try:
-                with self.seq_meta_path.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                with self.seq_meta_path.open("rb") as fh:
+                    data = decode(fh.read())
                 self.tick_seq = int(data.get("last_tick_id", 0))
             except Exception:
                 self.tick_seq = 0
+        self._seq_updated_at: Optional[str] = None
+        self._seq_dirty = False
+        self._last_seq_flush = time.monotonic()
+        atexit.register(self.close)
+
+        # per-day output handles, opened once and rotated with the UTC day
+        # directory: tick observations are batched, tick_log rows are fsynced
+        self._sinks_dir: Optional[Path] = None
+        self._tick_obs_ring: Optional[WriteBackRing] = None
+        self._tick_log: Optional[SafeAppender] = None
+
+        self._day: Optional[str] = None
+        self._day_dir: Optional[Path] = None
 
         self.last_ts_per_pair: Dict[str, str] = {}
         self.trackers = {}
@@ -150,9 +364,55 @@ class PriceListener:
             self.trackers[pair] = tracker
 
     def _current_day_dir(self) -> Path:
-        day_dir = self.runs_base_dir / datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        day_dir.mkdir(parents=True, exist_ok=True)
-        return day_dir
+        day = utc_day_str()
+        if day != self._day:
+            # mkdir only on UTC day rollover, not on every tick
+            day_dir = self.runs_base_dir / day
+            day_dir.mkdir(parents=True, exist_ok=True)
+            self._day = day
+            self._day_dir = day_dir
+        return self._day_dir
+
+    def _flush_seq_meta(self) -> None:
+        if not self._seq_dirty:
+            return
+        meta = {
+            "last_tick_id": self.tick_seq,
+            "updated_at": self._seq_updated_at,
+        }
+        self._seq_dirty = False
+        self._last_seq_flush = time.monotonic()
+        try:
+            atomic_write_json(self.seq_meta_path, meta)
+        except Exception:
+            if self.logger:
+                self.logger.warning("Failed to write sequence_meta.json", exc_info=True)
+
+    def _open_sinks(self, day_dir: Path) -> None:
+        self._close_sinks()
+        self._tick_obs_ring = WriteBackRing(day_dir / "tick_observation.jsonl")
+        self._tick_log = SafeAppender(day_dir / "tick_log.csv")
+        self._sinks_dir = day_dir
+
+    def _close_sinks(self) -> None:
+        if self._tick_obs_ring is not None:
+            self._tick_obs_ring.close()
+            self._tick_obs_ring = None
+        if self._tick_log is not None:
+            self._tick_log.close()
+            self._tick_log = None
+        self._sinks_dir = None
+
+    def flush(self) -> None:
+        """Persist pending sequence metadata and buffered tick observations."""
+        self._flush_seq_meta()
+        if self._tick_obs_ring is not None:
+            self._tick_obs_ring.flush()
+
+    def close(self) -> None:
+        """Flush, then release the per-day output handles."""
+        self._flush_seq_meta()
+        self._close_sinks()
 
     def process_tick(
         self, pair: str, price: Optional[float], timestamp: Optional[str] = None
@@ -162,7 +422,7 @@ class PriceListener:
         """
         if timestamp is None:
             # fall back to UTC "now" if main ever passes None
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = utc_now()
 
         self.tick_seq += 1
         tick_id = self.tick_seq
@@ -175,20 +435,17 @@ class PriceListener:
             "source": "binance",
         }
 
-        tick_obs_path = day_dir / "tick_observation.jsonl"
-        with open(tick_obs_path, "a") as f:
-            f.write(json.dumps(tick_record) + "\n")
-
-        meta = {
-            "last_tick_id": self.tick_seq,
-            "updated_at": timestamp,
-        }
+        if day_dir != self._sinks_dir:
+            self._open_sinks(day_dir)
+        self._tick_obs_ring.append(encode_line(tick_record))
 
-        try:
-            atomic_write_json(self.seq_meta_path, meta)
-        except Exception:
-            if self.logger:
-                self.logger.warning("Failed to write sequence_meta.json", exc_info=True)
+        self._seq_updated_at = timestamp
+        self._seq_dirty = True
+        if (
+            time.monotonic() - self._last_seq_flush >= SEQ_META_FLUSH_SECONDS
+            or self.tick_seq % SEQ_META_FLUSH_TICKS == 0
+        ):
+            self._flush_seq_meta()
 
         last_ts = self.last_ts_per_pair.get(pair)
         if last_ts is not None and timestamp <= last_ts:
@@ -212,15 +469,17 @@ class PriceListener:
 
         anchor = self.pairs[0] if self.pairs else None
         if anchor and anchor in self.trackers:
-            a_prices = list(self.trackers[anchor].prices)
-            b_prices = list(tracker.prices)
-            window_prices = min(self.vol_window, len(a_prices), len(b_prices))
+            a_tracker = self.trackers[anchor]
+            window_prices = min(self.vol_window, len(a_tracker.prices), len(tracker.prices))
             if window_prices >= 2:
-                a_returns = log_returns(a_prices[-window_prices:], window_prices - 1)
-                b_returns = log_returns(b_prices[-window_prices:], window_prices - 1)
+                # reuse the returns both trackers already hold rather than
+                # re-deriving them from price copies on every tick
+                a_returns = a_tracker.recent_returns(window_prices - 1)
+                b_returns = tracker.recent_returns(window_prices - 1)
                 window_rets = min(len(a_returns), len(b_returns))
                 metrics["rolling_correlation"] = (
-                    rolling_corr(a_returns[-window_rets:], b_returns[-window_rets:], window_rets)
+                    # rolling_corr takes the aligned tail itself; no slice copies here
+                    rolling_corr(a_returns, b_returns, window_rets)
                     if window_rets >= 2
                     else 0.0
                 )
@@ -230,32 +489,8 @@ class PriceListener:
             metrics["rolling_correlation"] = 0.0
 
         # write combined tick log row
-        header = [
-            "timestamp",
-            "pair",
-            "price",
-            "log_return",
-            "rolling_mean",
-            "rolling_std",
-            "zscore",
-            "slope",
-            "range",
-            "rolling_correlation",
-        ]
-        row = [
-            timestamp,
-            pair,
-            price,
-            metrics.get("log_return"),
-            metrics.get("rolling_mean"),
-            metrics.get("rolling_std"),
-            metrics.get("zscore"),
-            metrics.get("slope"),
-            metrics.get("range"),
-            metrics.get("rolling_correlation"),
-        ]
-        tick_log_path = day_dir / "tick_log.csv"
-        safe_append_csv(tick_log_path, row, header=header)
+        row = (timestamp, pair, price, *_tick_log_metrics(metrics))
+        self._tick_log.append_csv(row, header=TICK_LOG_HEADER)
         return metrics
 
 
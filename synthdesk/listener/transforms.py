@@ -61,12 +61,9 @@ def log_returns(prices: Sequence[float], window: int) -> list[float]:
     n_returns = min(window, len(prices) - 1)
     slice_prices = prices[-(n_returns + 1) :]
 
-    returns: list[float] = []
-    for prev, cur in zip(slice_prices[:-1], slice_prices[1:]):
-        if prev <= 0 or cur <= 0:
-            continue
-        returns.append(log_return(prev, cur))
-    return returns
+    # positivity is filtered inline, so log_return()'s own checks are skipped
+    log = math.log
+    return [log(cur / prev) for prev, cur in zip(slice_prices, slice_prices[1:]) if prev > 0 and cur > 0]
 
 
 def zscore(x: float, mean: float, std: float) -> float:
@@ -142,7 +139,7 @@ def rolling_volatility(prices: Sequence[float], window: int) -> float:
     window_prices = prices[-window:]
     if len(window_prices) < 2:
         return 0.0
-    pct_changes = [percentage_change(a, b) for a, b in zip(window_prices[:-1], window_prices[1:]) if a != 0]
+    pct_changes = [(b - a) / a for a, b in zip(window_prices, window_prices[1:]) if a != 0]
     if len(pct_changes) < 2:
         return 0.0
     return rolling_std(pct_changes, len(pct_changes))
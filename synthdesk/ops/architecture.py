@@ -7,22 +7,38 @@ internal records only. This is descriptive historiography, not planning.
 
 from __future__ import annotations
 
-import os
 import re
-from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 
+from synthdesk.listener.io.atomic import create_exclusive_bytes
+from synthdesk.utils.time import utc_day_str
 
+_MONTH_RE = re.compile(r"\b(\d{4}-\d{2})\b")
+
+# substring terms; "recommend" also covers "recommended" / "recommendation"
+_BANNED_TERMS = (
+    "should",
+    "recommend",
+    "refactor",
+    "roadmap",
+    "plan",
+    "next step",
+)
+
+
+@cache
 def _synthdesk_dir() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@cache
 def _architecture_dir() -> Path:
     return _synthdesk_dir() / "architecture"
 
 
 def _month_utc() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m")
+    return utc_day_str()[:7]
 
 
 def _extract_month(window: str) -> str:
@@ -30,7 +46,9 @@ def _extract_month(window: str) -> str:
     Best-effort YYYY-MM extraction for naming the artifact file.
     """
 
-    match = re.search(r"\b(\d{4}-\d{2})\b", str(window))
+    window = str(window)
+    # no dash, no YYYY-MM: skip the regex
+    match = _MONTH_RE.search(window) if "-" in window else None
     return match.group(1) if match else _month_utc()
 
 
@@ -40,17 +58,7 @@ def _contains_banned_language(markdown: str) -> bool:
     """
 
     lowered = markdown.lower()
-    banned = (
-        "should",
-        "recommend",
-        "recommended",
-        "recommendation",
-        "refactor",
-        "roadmap",
-        "plan",
-        "next step",
-    )
-    return any(term in lowered for term in banned)
+    return any(term in lowered for term in _BANNED_TERMS)
 
 
 def _fallback_markdown(
@@ -87,11 +95,14 @@ def write_architecture_drift(
     ledger_excerpts: str,
     git_diff_summary: str,
     invariant_activity: str,
+    *,
+    durable: bool = False,
 ) -> bool:
     """
     Write an exclusive-create drift note artifact for the given window.
 
     Path: synthdesk/architecture/drift_note_<YYYY-MM>.md
+    With `durable=True` the note is fsynced before returning.
     """
 
     out_dir = _architecture_dir()
@@ -126,12 +137,8 @@ def write_architecture_drift(
 
     try:
         out_dir.mkdir(parents=True, exist_ok=True)
-        with path.open("x", encoding="utf-8") as handle:
-            handle.write(markdown)
-            if not markdown.endswith("\n"):
-                handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
+        payload = markdown if markdown.endswith("\n") else markdown + "\n"
+        create_exclusive_bytes(path, payload.encode("utf-8"), durable=durable)
     except Exception:
         return False
 
@@ -7,22 +7,28 @@ without mutating any system state beyond writing the artifact file.
 
 from __future__ import annotations
 
-import os
 import re
-from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 
+from synthdesk.listener.io.atomic import create_exclusive_bytes
+from synthdesk.utils.time import utc_day_str
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@cache
 def _synthdesk_dir() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@cache
 def _invariants_dir() -> Path:
     return _synthdesk_dir() / "invariants"
 
 
 def _today_utc() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return utc_day_str()
 
 
 def _safe_slug(value: str) -> str:
@@ -33,7 +39,7 @@ def _safe_slug(value: str) -> str:
     value = str(value).strip()
     if not value:
         return "unknown"
-    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", value)
+    slug = _SLUG_RE.sub("_", value)
     slug = slug.strip("._-") or "unknown"
     return slug[:80]
 
@@ -42,6 +48,8 @@ def write_invariant_review(
     expectation_id: str,
     expectation_text: str,
     violation_context: str,
+    *,
+    durable: bool = False,
 ) -> bool:
     """
     Create a fixed-schema Markdown artifact for a violated expectation.
@@ -49,6 +57,7 @@ def write_invariant_review(
     - Human-invoked only: this function does not schedule itself.
     - Never overwrites existing files.
     - Swallows AI/IO failures safely.
+    - Fsyncs the artifact only when `durable=True`.
     """
 
     markdown = None
@@ -90,12 +99,8 @@ def write_invariant_review(
 
     try:
         out_dir.mkdir(parents=True, exist_ok=True)
-        with path.open("x", encoding="utf-8") as handle:
-            handle.write(markdown)
-            if not markdown.endswith("\n"):
-                handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
+        payload = markdown if markdown.endswith("\n") else markdown + "\n"
+        create_exclusive_bytes(path, payload.encode("utf-8"), durable=durable)
     except Exception:
         return False
 
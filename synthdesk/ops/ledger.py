@@ -8,17 +8,40 @@ Intent: compress daily inputs into an authoritative, append-only memory artifact
 from __future__ import annotations
 
 import os
-from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
+from synthdesk.utils.time import utc_day_str
 
+
+@cache
 def _default_ledger_path() -> Path:
     return Path(__file__).resolve().parents[1] / "ledger.md"
 
 
 def _today_utc() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return utc_day_str()
+
+
+def _fallback_entry(git_diff: str, notes: str, state: str, *, error: str) -> str:
+    return (
+        f"# Ledger: {_today_utc()}\n\n"
+        "## Summary\n"
+        "Ledger synthesis unavailable; entry recorded without synthesis.\n\n"
+        "## Events\n"
+        "- Time (if known): Ledger synthesis attempted but unavailable.\n\n"
+        "## Artifacts\n"
+        "- git diff --stat:\n"
+        f"{git_diff.strip()}\n"
+        "- notes:\n"
+        f"{notes.strip()}\n"
+        "- state:\n"
+        f"{state.strip()}\n\n"
+        "## Metrics\n"
+        "- Tokens: (unknown)\n"
+        f"- Errors: {error}\n"
+    )
 
 
 def append_synthesized_ledger(
@@ -43,31 +66,19 @@ def append_synthesized_ledger(
         entry = synthesize_ledger(git_diff=git_diff, notes=notes, state=state).strip()
     except Exception as e:
         # Facts-only fallback so the canonical ledger still records the day.
-        entry = (
-            f"# Ledger: {_today_utc()}\n\n"
-            "## Summary\n"
-            "Ledger synthesis unavailable; entry recorded without synthesis.\n\n"
-            "## Events\n"
-            "- Time (if known): Ledger synthesis attempted but unavailable.\n\n"
-            "## Artifacts\n"
-            "- git diff --stat:\n"
-            f"{git_diff.strip()}\n"
-            "- notes:\n"
-            f"{notes.strip()}\n"
-            "- state:\n"
-            f"{state.strip()}\n\n"
-            "## Metrics\n"
-            "- Tokens: (unknown)\n"
-            f"- Errors: {type(e).__name__}: {e}\n"
-        )
+        entry = _fallback_entry(git_diff, notes, state, error=f"{type(e).__name__}: {e}")
 
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            payload = "\n\n" + entry + "\n"
-            handle.write(payload)
-            handle.flush()
-            os.fsync(handle.fileno())
+        # one O_APPEND write per entry so concurrent appenders cannot interleave
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            data = memoryview(("\n\n" + entry + "\n").encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
     except Exception:
         return False
 
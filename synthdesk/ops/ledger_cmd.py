@@ -11,7 +11,18 @@ def _git_diff_stat() -> str:
     Lightweight summary of repo changes for the ledger.
     """
 
-    return subprocess.getoutput("git diff --stat")
+    # exec git directly rather than through /bin/sh; stderr merged like getoutput()
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--stat"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            check=False,
+        )
+    except OSError as e:
+        return f"git diff --stat unavailable: {e}"
+    return result.stdout.removesuffix("\n")
 
 
 def run_ledger(notes: str, state: str) -> bool:
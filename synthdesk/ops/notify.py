@@ -1,10 +1,105 @@
+import atexit
 import json
 import os
+import queue
+import select
+import threading
 import time
-from urllib.request import Request, urlopen
+from http.client import HTTPException, HTTPSConnection
+from typing import Optional
+
+API_HOST = "api.telegram.org"
+
+# one keep-alive connection reused across notifications (no TLS handshake per send)
+_CONN: Optional[HTTPSConnection] = None
+_CONN_LOCK = threading.Lock()
+
+# sends happen on one background thread; callers only enqueue. When the queue
+# is full the message is dropped (notifications must never stall the caller).
+_QUEUE_MAX = 64
+_EXIT_DRAIN_SECONDS = 5.0
+_QUEUE: "queue.Queue[Optional[tuple[str, bytes]]]" = queue.Queue(maxsize=_QUEUE_MAX)
+_WORKER: Optional[threading.Thread] = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _post_json(path: str, data: bytes) -> None:
+    global _CONN
+    with _CONN_LOCK:
+        sock = _CONN.sock if _CONN is not None else None
+        if sock is not None and select.select([sock], [], [], 0)[0]:
+            # an idle keep-alive only turns readable when the server closed it
+            # (or sent something unsolicited): reconnect before sending
+            _CONN.close()
+            _CONN = None
+        for attempt in (1, 2):
+            reused = _CONN is not None
+            if _CONN is None:
+                _CONN = HTTPSConnection(API_HOST, timeout=5)
+            try:
+                _CONN.request("POST", path, body=data, headers={"Content-Type": "application/json"})
+            except (OSError, HTTPException):
+                _CONN.close()
+                _CONN = None
+                if attempt == 2 or not reused:
+                    raise
+                # the request was not written, so resending cannot duplicate it
+                continue
+            try:
+                response = _CONN.getresponse()
+                body = response.read()
+            except (OSError, HTTPException):
+                # the message may already have been delivered; sendMessage is
+                # not idempotent, so a failed response is a drop, not a resend
+                _CONN.close()
+                _CONN = None
+                raise
+            if response.status >= 400:
+                raise HTTPException(f"HTTP {response.status}: {body[:200]!r}")
+            return
+
+
+def _log_failure(reason: str) -> None:
+    try:
+        with open("synthdesk/ops/notify.log", "a", encoding="utf-8") as f:
+            f.write(f"{time.time()} telegram notify failed: {reason}\n")
+    except Exception:
+        return
+
+
+def _run_worker() -> None:
+    while True:
+        item = _QUEUE.get()
+        if item is None:
+            return
+        try:
+            _post_json(*item)
+        except Exception as e:
+            # never fail the system because of notifications
+            _log_failure(str(e))
+
+
+def _drain_at_exit() -> None:
+    # give queued messages (e.g. a crash report) a bounded chance to go out
+    try:
+        _QUEUE.put(None, timeout=_EXIT_DRAIN_SECONDS)
+    except queue.Full:
+        return
+    if _WORKER is not None:
+        _WORKER.join(_EXIT_DRAIN_SECONDS)
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    with _WORKER_LOCK:
+        if _WORKER is None:
+            _WORKER = threading.Thread(target=_run_worker, name="notify_telegram", daemon=True)
+            _WORKER.start()
+            atexit.register(_drain_at_exit)
 
 
 def notify_telegram(message: str) -> None:
+    """Queue a Telegram message; returns immediately, the send happens in the background."""
     if os.getenv("SYNTHDESK_NOTIFY_TELEGRAM") != "1":
         return
 
@@ -14,7 +109,7 @@ def notify_telegram(message: str) -> None:
     if not token or not chat_id:
         return
 
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
+    path = f"/bot{token}/sendMessage"
     payload = {
         "chat_id": chat_id,
         "text": message,
@@ -23,13 +118,9 @@ def notify_telegram(message: str) -> None:
 
     try:
         data = json.dumps(payload).encode("utf-8")
-        req = Request(url, data=data, headers={"Content-Type": "application/json"})
-        with urlopen(req, timeout=5):
-            return
+        _ensure_worker()
+        _QUEUE.put_nowait((path, data))
+    except queue.Full:
+        _log_failure("queue full, message dropped")
     except Exception as e:
-        # never fail the system because of notifications
-        try:
-            with open("synthdesk/ops/notify.log", "a", encoding="utf-8") as f:
-                f.write(f"{time.time()} telegram notify failed: {e}\n")
-        except Exception:
-            return
+        _log_failure(str(e))
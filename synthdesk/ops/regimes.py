@@ -7,15 +7,26 @@ regime summary for archival context. No predictions, no advice, no trades.
 
 from __future__ import annotations
 
-import os
 import re
+from functools import cache
 from pathlib import Path
 
+from synthdesk.listener.io.atomic import create_exclusive_bytes
 
+_DATE_FULL_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATE_SUB_RE = re.compile(r"[^0-9-]+")
+# deletes the characters _DATE_SUB_RE keeps; an empty result means nothing to replace
+_DATE_CHARS = str.maketrans("", "", "0123456789-")
+
+_BANNED_TERMS = ("bullish", "bearish", "enter", "exit", "expect", "should", "likely")
+
+
+@cache
 def _synthdesk_dir() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@cache
 def _regimes_dir() -> Path:
     return _synthdesk_dir() / "regimes"
 
@@ -26,9 +37,10 @@ def _safe_date(value: str) -> str:
     """
 
     value = str(value).strip()
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+    if _DATE_FULL_RE.fullmatch(value):
         return value
-    value = re.sub(r"[^0-9-]+", "_", value).strip("_")
+    if value.translate(_DATE_CHARS):
+        value = _DATE_SUB_RE.sub("_", value).strip("_")
     return value or "unknown-date"
 
 
@@ -38,8 +50,7 @@ def _contains_banned_language(markdown: str) -> bool:
     """
 
     lowered = markdown.lower()
-    banned = ("bullish", "bearish", "enter", "exit", "expect", "should", "likely")
-    return any(term in lowered for term in banned)
+    return any(term in lowered for term in _BANNED_TERMS)
 
 
 def _fallback_markdown(date: str, window: str, aggregates: str, prior_period_notes: str, *, error: str) -> str:
@@ -66,11 +77,14 @@ def write_regime_summary(
     window: str,
     aggregates: str,
     prior_period_notes: str = "",
+    *,
+    durable: bool = False,
 ) -> bool:
     """
     Create an append-only regime summary artifact (exclusive create).
 
     Writes: synthdesk/regimes/regime_summary_<YYYY-MM-DD>.md
+    With `durable=True` the summary is fsynced before returning.
     """
 
     safe_date = _safe_date(date)
@@ -105,12 +119,8 @@ def write_regime_summary(
 
     try:
         out_dir.mkdir(parents=True, exist_ok=True)
-        with path.open("x", encoding="utf-8") as handle:
-            handle.write(markdown)
-            if not markdown.endswith("\n"):
-                handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
+        payload = markdown if markdown.endswith("\n") else markdown + "\n"
+        create_exclusive_bytes(path, payload.encode("utf-8"), durable=durable)
     except Exception:
         return False
 
@@ -8,19 +8,37 @@ human to review. This module never applies changes automatically.
 
 from __future__ import annotations
 
+import itertools
 import os
 import socket
 import traceback
 import time
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
+# temp-file suffix: pid (refreshed in forked children) + a process-local counter
+_PID = os.getpid()
+_TMP_COUNTER = itertools.count()
 
+
+def _reset_after_fork() -> None:
+    global _PID, _TMP_COUNTER
+    _PID = os.getpid()
+    _TMP_COUNTER = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+@cache
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@cache
 def _default_output_path() -> Path:
     return _repo_root() / "auto_patch.txt"
 
@@ -31,11 +49,11 @@ def _atomic_write_text(path: Path, text: str) -> None:
     """
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.{time.time_ns()}.tmp")
+    tmp = path.with_suffix(path.suffix + f".{_PID}.{next(_TMP_COUNTER)}.tmp")
+    if not text.endswith("\n"):
+        text += "\n"
     with tmp.open("w", encoding="utf-8") as handle:
         handle.write(text)
-        if not text.endswith("\n"):
-            handle.write("\n")
         handle.flush()
         os.fsync(handle.fileno())
     tmp.replace(path)
@@ -48,7 +66,7 @@ def notify_repair(exception_summary: str) -> None:
         return
 
     host = socket.gethostname()
-    pid = os.getpid()
+    pid = _PID
     ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     msg = (
@@ -96,7 +114,7 @@ def dump_repair_suggestion(exc: BaseException, *, output_path: Optional[Path] =
     header = (
         f"auto_patch.txt (non-destructive; review manually)\n"
         f"timestamp_utc: {datetime.now(timezone.utc).isoformat()}\n"
-        f"pid: {os.getpid()}\n"
+        f"pid: {_PID}\n"
         f"exception: {exception_summary}\n"
     )
 
@@ -120,12 +138,10 @@ def dump_repair_suggestion(exc: BaseException, *, output_path: Optional[Path] =
     try:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
+        if not payload.endswith("\n"):
+            payload += "\n"
         with path.open("w", encoding="utf-8") as handle:
             handle.write(payload)
-            if not payload.endswith("\n"):
-                handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
         if suggestion is not None:
             notify_repair(exception_summary)
     except Exception:
@@ -0,0 +1,64 @@
+"""Line codec for the append-only JSONL spine and observation files.
+
+Records are framed as one compact JSON object per line so the watchdog,
+inspection tools, and downstream readers can consume them without a decoder
+of their own. orjson is used when installed. Both encoders write UTF-8
+without ASCII escaping and coerce non-str dict keys the same way, but the
+bytes still differ in a few cases:
+
+- NaN and infinities: orjson writes ``null``, the stdlib writes ``NaN`` /
+  ``Infinity``.
+- Float text: exponents are spelled differently (``1e-5`` vs ``1e-05``).
+- Integers outside the 64-bit range: orjson raises ``TypeError``, the stdlib
+  writes them.
+
+Readers should therefore compare decoded records, not raw lines.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    # Optional accelerator; emits/accepts UTF-8 bytes directly.
+    import orjson
+except ImportError:
+    _loads = json.loads  # accepts bytes as well
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+else:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # non-str keys are stringified, as json.dumps does, instead of raising
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def encode_line(record: Any) -> bytes:
+    """Encode one record as a newline-terminated UTF-8 JSON line."""
+    return _dumps(record) + b"\n"
+
+
+def decode(data: bytes | str) -> Any:
+    """Decode one JSON document (a line or a whole file); raises ValueError."""
+    return _loads(data)
+
+
+def iter_records(path: str | Path) -> Iterator[Any]:
+    """Yield decoded records from a JSONL file in append order.
+
+    Blank and malformed lines are skipped; a torn final line from an
+    interrupted append must not hide the records before it.
+    """
+    with open(path, "rb") as handle:
+        for line in handle:
+            if line.isspace():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                continue
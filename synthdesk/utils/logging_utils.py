@@ -1,9 +1,25 @@
 """Logging utilities for SynthDesk listener."""
 
+import errno
 import logging
+import os
 from logging.handlers import RotatingFileHandler
 from typing import Optional, Union
 
+_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+
+def _check_writable(log_file: str) -> None:
+    """Raise the OSError an eager open would have, without creating the file."""
+    path = os.path.abspath(log_file)
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), log_file)
+    if os.path.isdir(path):
+        raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), log_file)
+    if not os.access(path if os.path.exists(path) else directory, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), log_file)
+
 
 def configure_logging(
     level: Union[int, str] = "INFO",
@@ -25,15 +41,19 @@ def configure_logging(
         return logger
 
     logger.setLevel(level)
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
     stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
+    stream_handler.setFormatter(_FORMATTER)
     logger.addHandler(stream_handler)
 
     if log_file:
-        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
-        file_handler.setFormatter(formatter)
+        # delay=True: the file is opened on the first record, not at configuration;
+        # an unwritable path still fails here rather than on the first emit
+        _check_writable(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
     logger.propagate = False
@@ -2,9 +2,39 @@
 time formatting utilities.
 """
 
+import time
 from datetime import datetime, timezone
 
+# (epoch day index, "YYYY-MM-DD"); Unix time has no leap seconds, so UTC days
+# are exactly 86400-second buckets.
+_DAY_CACHE = (-1, "")
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS"); only the microseconds change within a second
+_SECOND_CACHE = (-1, "")
+
 
 def utc_now():
-    return datetime.now(timezone.utc).isoformat()
+    """Return the current UTC time formatted exactly like datetime.isoformat()."""
+    global _SECOND_CACHE
+    second, micro = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _SECOND_CACHE
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+        _SECOND_CACHE = (second, prefix)
+    if micro:
+        return f"{prefix}.{micro:06d}+00:00"
+    # isoformat() omits the fraction when it is zero
+    return prefix + "+00:00"
+
 
+def utc_day_str() -> str:
+    """Return the current UTC date as YYYY-MM-DD, reformatted only on rollover."""
+    global _DAY_CACHE
+    now = time.time()
+    day = int(now // 86400)
+    cached_day, cached_str = _DAY_CACHE
+    if day != cached_day:
+        tm = time.gmtime(now)
+        cached_str = f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        _DAY_CACHE = (day, cached_str)
+    return cached_str
@@ -2,6 +2,14 @@
 SynthDesk Listener package entrypoint and exports.
 """
 
-from .main import run
-
 __all__ = ["run"]
+
+
+def __getattr__(name):
+    # `run` is imported on first use, so entrypoints that never call it
+    # (watchdog, run, daemon) start without loading the listener runtime
+    if name == "run":
+        from .main import run
+
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import json
+import signal
 import socket
+import threading
 import time
 import uuid
 from datetime import datetime, timezone
@@ -12,26 +15,38 @@ from typing import Any, Dict, Iterable, Optional
 
 from synthdesk.event_envelope import EventEnvelope
 from synthdesk.event_spine_writer import append_event_spine
-from synthdesk.listener.io.atomic import atomic_write_json, safe_append_csv, safe_append_text
+from synthdesk.listener.io.atomic import SafeAppender, atomic_write_json, ensure_dir
 from synthdesk.listener.price_listener import PriceListener, fetch_prices
 from synthdesk.listener.version import VERSION
 from synthdesk.utils.logging_utils import configure_logging
+from synthdesk.utils.time import utc_now
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "poll_interval_seconds": 10,
+    # minimum spacing of heartbeat lines, independent of the poll cadence;
+    # 0 writes one per poll. Keep it well under the watchdog gap threshold.
+    "heartbeat_interval_seconds": 0,
     "pairs": ["BTCUSDT", "ETHUSDT"],
     "vol_window": 60,
     "log_level": "INFO",
     "log_file": None,
 }
 
+# fixed for the process; module attributes so tests can override them
+_HOSTNAME = socket.gethostname()
+_RUNS_DIR = Path(__file__).resolve().parents[1] / "runs" / VERSION
+
+# event ids are one random prefix per process plus a sequence number: unique
+# across runs without a urandom read per event; consumers treat them as opaque
+_RUN_ID = uuid.uuid4().hex
+_EVENT_SEQ = itertools.count()
+
 
 def _get_run_day_dir() -> Path:
     """
     Return the runs/<VERSION>/<YYYY-MM-DD> directory, creating it if needed.
     """
-    base = Path(__file__).resolve().parents[1] / "runs" / VERSION
-    day_dir = base / datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    day_dir = _RUNS_DIR / datetime.now(timezone.utc).strftime("%Y-%m-%d")
     day_dir.mkdir(parents=True, exist_ok=True)
     return day_dir
 
@@ -46,29 +61,21 @@ def load_config(config_path: Path) -> Dict[str, Any]:
 
 def _emit_listener_event(event_spine_path: Path, event_type: str, payload: Dict[str, Any]) -> None:
     event = EventEnvelope(
-        event_id=str(uuid.uuid4()),
+        event_id=f"{_RUN_ID}-{next(_EVENT_SEQ)}",
         event_type=event_type,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=utc_now(),
         source="synthdesk_listener",
         version=VERSION,
-        host=socket.gethostname(),
+        host=_HOSTNAME,
         payload=payload,
     )
     try:
-        event_spine_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(event_spine_path.parent)
         append_event_spine(event_spine_path, event)
     except OSError:
         return
 
 
-def _parse_iso8601(timestamp: str) -> Optional[datetime]:
-    try:
-        candidate = timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp
-        return datetime.fromisoformat(candidate)
-    except ValueError:
-        return None
-
-
 def _emit_invariant_violation_payload(
     event_spine_path: Path,
     invariant_id: str,
@@ -83,7 +90,7 @@ def _emit_invariant_violation_payload(
             "event_type": "invariant.violation",
             "invariant_id": invariant_id,
             "severity": severity,
-            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or utc_now(),
             "details": details,
         },
     )
@@ -109,16 +116,21 @@ def _emit_invariant_violation(
     )
 
 
-def run(config_path: Optional[str] = None) -> None:
+def run(config_path: Optional[str] = None, stop_event: Optional[threading.Event] = None) -> None:
+    """Poll prices until interrupted or until `stop_event` is set."""
+    if stop_event is None:
+        stop_event = threading.Event()
     logger = None
-    event_spine_path = Path(__file__).resolve().parents[1] / "runs" / VERSION / "event_spine.jsonl"
+    heartbeat_log: Optional[SafeAppender] = None
+    prices_log: Optional[SafeAppender] = None
+    event_spine_path = _RUNS_DIR / "event_spine.jsonl"
     try:
         resolved_path = Path(config_path) if config_path else Path(__file__).with_name("config.json")
         config = load_config(resolved_path)
 
         logger = configure_logging(config.get("log_level", "INFO"), log_file=config.get("log_file"))
 
-        listener_started_at = datetime.now(timezone.utc)
+        listener_started_mono = time.monotonic()
         heartbeat_gap_violation_emitted = False
 
         run_meta = {
@@ -128,16 +140,19 @@ def run(config_path: Optional[str] = None) -> None:
             "poll_interval": config.get("poll_interval_seconds"),
             "log_level": config.get("log_level"),
         }
-        base = Path(__file__).resolve().parents[1] / "runs" / VERSION
-        base.mkdir(parents=True, exist_ok=True)
-        meta_path = base / "run_meta.json"
+        _RUNS_DIR.mkdir(parents=True, exist_ok=True)
+        meta_path = _RUNS_DIR / "run_meta.json"
         atomic_write_json(meta_path, run_meta)
 
         day_dir = _get_run_day_dir()
         prices_path = day_dir / "prices.csv"
         heartbeat_path = day_dir / "heartbeat.log"
+        # opened once for the run; each record is still flushed + fsynced
+        heartbeat_log = SafeAppender(heartbeat_path)
+        prices_log = SafeAppender(prices_path)
 
         poll_interval = max(1, int(config.get("poll_interval_seconds", 10)))
+        heartbeat_interval = max(0.0, float(config.get("heartbeat_interval_seconds", 0)))
 
         _emit_listener_event(
             event_spine_path,
@@ -155,12 +170,20 @@ def run(config_path: Optional[str] = None) -> None:
         )
 
         logger.info("Starting listener for pairs %s with poll interval %ss", config["pairs"], poll_interval)
+        # polls are aligned to a fixed monotonic schedule so work time does not
+        # accumulate as drift; slots missed by a slow cycle are skipped
+        next_poll = next_heartbeat = time.monotonic()
+        # monotonic time of each pair's last accepted tick, for the gap check
+        last_tick_mono: Dict[str, float] = {}
         while True:
             now_dt = datetime.now(timezone.utc)
-            hb_ts = now_dt.isoformat()
-            safe_append_text(heartbeat_path, f"{hb_ts} alive")
-            prices = fetch_prices(config["pairs"], logger=logger)
+            # one formatted timestamp per cycle, shared by heartbeat, rows and ticks
             now_ts = now_dt.isoformat()
+            cycle_mono = time.monotonic()
+            if cycle_mono >= next_heartbeat:
+                heartbeat_log.append_text(f"{now_ts} alive")
+                next_heartbeat = cycle_mono + heartbeat_interval
+            prices = fetch_prices(config["pairs"], logger=logger)
             if len(prices) != len(config["pairs"]):
                 missing_pairs = [pair for pair in config["pairs"] if pair not in prices]
                 if missing_pairs:
@@ -172,12 +195,13 @@ def run(config_path: Optional[str] = None) -> None:
                         "observation for each configured pair in poll cycle",
                         "degraded",
                     )
+            # the cycle's rows go out in one write + fsync, before any is processed
+            prices_log.append_csv_rows(
+                [[now_ts, pair, price] for pair, price in prices.items() if price is not None],
+                header=["timestamp", "pair", "price"],
+            )
             for pair, price in prices.items():
                 prev_ts = listener.last_ts_per_pair.get(pair)
-                if price is not None:
-                    header = ["timestamp", "pair", "price"]
-                    row = [now_ts, pair, price]
-                    safe_append_csv(prices_path, row, header=header)
                 listener.process_tick(pair, price, timestamp=now_ts)
                 if prev_ts is not None and now_ts <= prev_ts:
                     _emit_invariant_violation(
@@ -188,13 +212,12 @@ def run(config_path: Optional[str] = None) -> None:
                         "timestamp must be greater than previous per-pair timestamp",
                         "ignored",
                     )
+                else:
+                    last_tick_mono[pair] = cycle_mono
+            listener.flush()
             if not heartbeat_gap_violation_emitted:
                 for pair in config["pairs"]:
-                    last_ts = listener.last_ts_per_pair.get(pair)
-                    last_dt = _parse_iso8601(last_ts) if last_ts else None
-                    if last_dt is None:
-                        last_dt = listener_started_at
-                    gap_seconds = (now_dt - last_dt).total_seconds()
+                    gap_seconds = cycle_mono - last_tick_mono.get(pair, listener_started_mono)
                     if gap_seconds > 30:
                         _emit_invariant_violation_payload(
                             event_spine_path,
@@ -205,7 +228,14 @@ def run(config_path: Optional[str] = None) -> None:
                         )
                         heartbeat_gap_violation_emitted = True
                         break
-            time.sleep(poll_interval)
+            next_poll += poll_interval
+            now_mono = time.monotonic()
+            if now_mono >= next_poll:
+                next_poll += ((now_mono - next_poll) // poll_interval + 1) * poll_interval
+            if stop_event.wait(next_poll - now_mono):
+                break
+        _emit_listener_event(event_spine_path, "listener.stop", {"reason": "stop_requested"})
+        logger.info("Stopping listener (stop requested)")
     except KeyboardInterrupt:
         _emit_listener_event(event_spine_path, "listener.stop", {"reason": "keyboard_interrupt"})
         if logger is not None:
@@ -224,13 +254,25 @@ def run(config_path: Optional[str] = None) -> None:
         except Exception:
             pass
         raise
+    finally:
+        for appender in (heartbeat_log, prices_log):
+            if appender is not None:
+                appender.close()
 
 
 def cli(argv: Optional[Iterable[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="SynthDesk Listener v0.1")
     parser.add_argument("-c", "--config", dest="config", help="Path to config.json", required=False)
     args = parser.parse_args(list(argv) if argv is not None else None)
-    run(args.config)
+
+    stop_event = threading.Event()
+
+    def _handle_sigterm(_signum: int, _frame: object) -> None:
+        stop_event.set()
+
+    # SIGTERM ends the current wait at once; SIGINT keeps raising KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    run(args.config, stop_event=stop_event)
 
 
 if __name__ == "__main__":
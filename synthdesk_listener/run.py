@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
 import sys
-import urllib.error
+import threading
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+from synthdesk.spine_codec import decode
+
 
 LISTENER_VERSION = "v0.x"
 COINBASE_EXCHANGE = "coinbase"
-COINBASE_CANDLES_URL_TEMPLATE = "https://api.exchange.coinbase.com/products/{product_id}/candles"
+COINBASE_API_HOST = "api.exchange.coinbase.com"
+COINBASE_CANDLES_PATH_TEMPLATE = "/products/{product_id}/candles"
+
+# one keep-alive connection per fetching thread, reused across fetches (the
+# daemon calls cli() in-process every tick), so candle requests skip the
+# TCP + TLS handshake; http.client connections cannot be shared across threads
+_LOCAL = threading.local()
+
+# symbols are fetched concurrently on a small persistent pool, so each worker
+# keeps its connection from one tick to the next
+_MAX_PARALLEL_FETCHES = 8
+_FETCH_POOL: ThreadPoolExecutor | None = None
+_FETCH_POOL_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -74,14 +89,17 @@ def _last_fully_closed_interval(resolution_seconds: int, now: datetime) -> Inter
 def _jsonl_has_interval(path: Path, symbol: str, resolution: str, interval_start: str) -> bool:
     if not path.exists():
         return False
+    # values appear in a line exactly as _append_jsonl serialized them; only
+    # lines containing both are parsed to confirm the match
+    symbol_needle = json.dumps(symbol, ensure_ascii=False).encode("utf-8")
+    start_needle = json.dumps(interval_start, ensure_ascii=False).encode("utf-8")
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with path.open("rb") as handle:
             for line in handle:
-                stripped = line.strip()
-                if not stripped:
+                if start_needle not in line or symbol_needle not in line:
                     continue
                 try:
-                    obj = json.loads(stripped)
+                    obj = json.loads(line)
                 except json.JSONDecodeError as exc:
                     raise ValueError(f"invalid_jsonl_line: {exc.msg}") from exc
                 if not isinstance(obj, dict):
@@ -97,6 +115,23 @@ def _jsonl_has_interval(path: Path, symbol: str, resolution: str, interval_start
     return False
 
 
+def _https_get(path: str) -> tuple[int, bytes]:
+    for attempt in (1, 2):
+        conn = getattr(_LOCAL, "conn", None)
+        if conn is None:
+            conn = _LOCAL.conn = http.client.HTTPSConnection(COINBASE_API_HOST, timeout=10)
+        try:
+            conn.request("GET", path, headers={"User-Agent": "synthdesk-listener"})
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            _LOCAL.conn = None
+            if attempt == 2:
+                raise
+            # the server may have dropped the idle keep-alive; GET is safe to retry
+
+
 def _fetch_coinbase_candle(
     symbol: str,
     resolution_seconds: int,
@@ -110,25 +145,51 @@ def _fetch_coinbase_candle(
             "end": _format_utc(interval_end),
         }
     )
-    url = COINBASE_CANDLES_URL_TEMPLATE.format(product_id=urllib.parse.quote(symbol)) + "?" + query
-    request = urllib.request.Request(url, method="GET", headers={"User-Agent": "synthdesk-listener"})
+    path = COINBASE_CANDLES_PATH_TEMPLATE.format(product_id=urllib.parse.quote(symbol)) + "?" + query
     try:
-        with urllib.request.urlopen(request, timeout=10) as response:
-            body = response.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        raise RuntimeError(f"http_status={exc.code}") from exc
-    except (urllib.error.URLError, TimeoutError) as exc:
+        status, raw = _https_get(path)
+    except (OSError, http.client.HTTPException) as exc:
         raise RuntimeError("network_error") from exc
-
+    if not 200 <= status < 300:
+        raise RuntimeError(f"http_status={status}")
     try:
-        payload = json.loads(body)
-    except json.JSONDecodeError as exc:
+        # parsed straight from bytes; undecodable UTF-8 is invalid JSON too
+        payload = decode(raw)
+    except ValueError as exc:
         raise ValueError("invalid_schema: invalid_json") from exc
     if not isinstance(payload, list):
         raise ValueError("invalid_schema: expected list")
     return payload
 
 
+def _fetch_pool() -> ThreadPoolExecutor:
+    global _FETCH_POOL
+    with _FETCH_POOL_LOCK:
+        if _FETCH_POOL is None:
+            _FETCH_POOL = ThreadPoolExecutor(
+                max_workers=_MAX_PARALLEL_FETCHES, thread_name_prefix="candle_fetch"
+            )
+        return _FETCH_POOL
+
+
+def _fetch_candles(symbols: list[str], resolution_seconds: int, interval: Interval) -> list[Any]:
+    """Fetch one candle payload per symbol concurrently; failures are returned, not raised.
+
+    Results are in `symbols` order; each is the payload list or the
+    RuntimeError/ValueError `_fetch_coinbase_candle` raised for that symbol.
+    """
+
+    def fetch_one(symbol: str) -> Any:
+        try:
+            return _fetch_coinbase_candle(symbol, resolution_seconds, interval.start, interval.end)
+        except (RuntimeError, ValueError) as exc:
+            return exc
+
+    if len(symbols) <= 1:
+        return [fetch_one(symbol) for symbol in symbols]
+    return list(_fetch_pool().map(fetch_one, symbols))
+
+
 def _validate_single_candle(
     payload: list[Any],
     expected_start_epoch: int,
@@ -159,9 +220,10 @@ def _validate_single_candle(
 
 def _append_jsonl(path: Path, obj: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(line + "\n")
+    line = json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n"
+    # encoded once and handed over in one binary write (no text-layer buffering)
+    with path.open("ab") as handle:
+        handle.write(line.encode("utf-8"))
 
 
 def _error_stderr(message: str) -> None:
@@ -189,6 +251,10 @@ def cli(argv: Iterable[str] | None = None) -> int:
     wrote_any = False
     skipped: list[str] = []
 
+    # dedupe up to the first unreadable day file; symbols before it are still
+    # fetched and appended first, exactly as a one-by-one pass would
+    pending: list[tuple[str, Path]] = []
+    dedupe_error: str | None = None
     for symbol in symbols:
         out_path = output_dir / interval.start.strftime("%Y-%m-%d") / f"listener_{symbol.lower()}.jsonl"
         try:
@@ -196,16 +262,19 @@ def cli(argv: Iterable[str] | None = None) -> int:
                 skipped.append(symbol)
                 continue
         except ValueError as exc:
-            _error_stderr(f"error=validation_failure symbol={symbol} detail={str(exc).replace(' ', '_')}")
-            return 2
+            dedupe_error = f"error=validation_failure symbol={symbol} detail={str(exc).replace(' ', '_')}"
+            break
+        pending.append((symbol, out_path))
 
-        try:
-            payload = _fetch_coinbase_candle(symbol, resolution_seconds, interval.start, interval.end)
-        except RuntimeError as exc:
-            _error_stderr(f"error=network_failure symbol={symbol} detail={str(exc)}")
+    fetched = _fetch_candles([symbol for symbol, _ in pending], resolution_seconds, interval)
+
+    # results are handled in symbol order; the first failure ends the run
+    for (symbol, out_path), payload in zip(pending, fetched):
+        if isinstance(payload, RuntimeError):
+            _error_stderr(f"error=network_failure symbol={symbol} detail={str(payload)}")
             return 1
-        except ValueError as exc:
-            _error_stderr(f"error=validation_failure symbol={symbol} detail={str(exc).replace(' ', '_')}")
+        if isinstance(payload, ValueError):
+            _error_stderr(f"error=validation_failure symbol={symbol} detail={str(payload).replace(' ', '_')}")
             return 2
 
         try:
@@ -231,6 +300,10 @@ def cli(argv: Iterable[str] | None = None) -> int:
         _append_jsonl(out_path, record)
         wrote_any = True
 
+    if dedupe_error is not None:
+        _error_stderr(dedupe_error)
+        return 2
+
     if not wrote_any:
         print(f"noop interval_start={interval_start_str} resolution={resolution} symbols={','.join(skipped)}")
     return 0
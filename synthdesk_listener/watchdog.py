@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import re
 import socket
 import sys
 import time
@@ -13,19 +14,62 @@ from typing import Iterable, Optional
 
 from synthdesk.event_envelope import EventEnvelope
 from synthdesk.event_spine_writer import append_event_spine
+from synthdesk.listener.io.atomic import atomic_write_json, ensure_dir
 from synthdesk.listener.version import VERSION
+from synthdesk.spine_codec import decode
 
 DEFAULT_GAP_SECONDS = 300
 DEFAULT_POLL_INTERVAL = 5.0
 
+# fixed for the process; module attribute so tests can override it
+_HOSTNAME = socket.gethostname()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _ListenerEvent:
     event_type: str
     timestamp: datetime
     event_id: str
 
 
+@dataclass(frozen=True, slots=True)
+class _SpineScan:
+    """Where the last scan of a spine file stopped, and what it had found."""
+
+    device: int
+    inode: int
+    offset: int
+    # trailing bytes of the last consumed line, to recognise the same file later
+    check: bytes = b""
+    last_downtime: Optional[datetime] = None
+    last_listener_event: Optional[_ListenerEvent] = None
+
+
+# the spine is append-only, so each poll parses only the lines added since
+# the previous one and folds them into the cached maxima. The state is also
+# saved beside the spine, so a new process (e.g. each --once run) resumes too.
+_SPINE_SCANS: dict[Path, _SpineScan] = {}
+_STATE_CHECK_BYTES = 64
+
+# last-heartbeat results per heartbeat.log, keyed by (inode, size, mtime_ns);
+# a file whose stat is unchanged since the previous poll is not re-read
+_HEARTBEAT_CACHE: dict[str, tuple[tuple[int, int, int], Optional[datetime]]] = {}
+
+# initial tail read for heartbeat.log (a line is ~40 bytes)
+_HEARTBEAT_TAIL_BYTES = 4096
+
+# only these event types matter to the watchdog; the spine codec never escapes
+# ASCII, so a line that can match has one of them as a literal JSON string.
+# The opening quote is left out of the pattern: the search then keys on the
+# rarer "l", and the few extra candidates are rejected by the full parse.
+_WATCHED_EVENT_RE = re.compile(rb'listener\.(?:downtime|start|stop|crash)"')
+
+# spine scans read blocks of this size and run the prefilter over each whole
+# block in C; only matching lines are sliced out. The spine is not mmapped:
+# a truncation while mapped is SIGBUS.
+_SCAN_BLOCK_BYTES = 1 << 20
+
+
 class _OneLineArgParser(argparse.ArgumentParser):
     def error(self, message: str) -> None:  # type: ignore[override]
         raise ValueError(message)
@@ -42,73 +86,244 @@ def _utc_now() -> datetime:
 def _parse_ts(value: str | None) -> Optional[datetime]:
     if not value:
         return None
+    if value.endswith("+00:00") and "Z" not in value:
+        # the shape the listener and watchdog write (isoformat() of an aware
+        # UTC datetime): parses straight to a timezone.utc datetime
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
     s = value.replace("Z", "+00:00")
     try:
         dt = datetime.fromisoformat(s)
     except ValueError:
         return None
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
+    # astimezone hands back dt itself when it is already timezone.utc
     return dt.astimezone(timezone.utc)
 
 
-def _read_last_heartbeat(path: Path) -> Optional[datetime]:
+def _read_last_heartbeat(path: str | Path) -> Optional[datetime]:
+    # only the end of the log is read: the tail is cut after a newline so its
+    # lines are exactly the file's last lines, and widened until it holds a
+    # non-blank one (or is the whole file)
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        with open(path, "rb") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            span = _HEARTBEAT_TAIL_BYTES
+            while True:
+                start = max(0, size - span)
+                handle.seek(start)
+                tail = handle.read(size - start)
+                if start > 0:
+                    tail = tail[tail.find(b"\n") + 1 :] if b"\n" in tail else b""
+                for raw in reversed(tail.decode("utf-8").splitlines()):
+                    raw = raw.strip()
+                    if not raw:
+                        continue
+                    ts = raw.split(" ")[0]
+                    return _parse_ts(ts)
+                if start == 0:
+                    return None
+                span *= 8
     except OSError:
         return None
-    for raw in reversed(lines):
-        raw = raw.strip()
-        if not raw:
-            continue
-        ts = raw.split(" ")[0]
-        return _parse_ts(ts)
-    return None
+
+
+def _cached_last_heartbeat(path: str, st: os.stat_result) -> Optional[datetime]:
+    key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _HEARTBEAT_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    ts = _read_last_heartbeat(path)
+    _HEARTBEAT_CACHE[path] = (key, ts)
+    return ts
 
 
 def _find_latest_heartbeat(runs_dir: Path) -> tuple[Optional[datetime], Optional[Path], bool]:
     latest = None
-    latest_path = None
+    latest_name = None
     heartbeat_files = False
-    for heartbeat_path in runs_dir.glob("*/heartbeat.log"):
+    # one directory listing plus one stat per run dir (the stat feeds the
+    # cache); paths stay plain strings until the winner is returned
+    try:
+        with os.scandir(runs_dir) as entries:
+            run_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+    except OSError:
+        return None, None, False
+    for name, run_path in run_dirs:
+        heartbeat_path = os.path.join(run_path, "heartbeat.log")
+        try:
+            st = os.stat(heartbeat_path)
+        except OSError:
+            continue
         heartbeat_files = True
-        ts = _read_last_heartbeat(heartbeat_path)
+        ts = _cached_last_heartbeat(heartbeat_path, st)
         if ts is None:
             continue
         if latest is None or ts > latest:
             latest = ts
-            latest_path = heartbeat_path
+            latest_name = name
+    latest_path = runs_dir / latest_name / "heartbeat.log" if latest_name is not None else None
     return latest, latest_path, heartbeat_files
 
 
+def _spine_state_path(spine: Path) -> Path:
+    return spine.with_suffix(".watchdog_state.json")
+
+
+def _load_spine_scan(path: Path) -> Optional[_SpineScan]:
+    """Restore the scan state a previous watchdog process saved for `path`.
+
+    The saved tail bytes must still precede the saved offset, so a spine that
+    was recreated (possibly reusing the inode) falls back to a full scan.
+    """
+    try:
+        data = decode(_spine_state_path(path).read_bytes())
+        check = bytes.fromhex(data["check"])
+        offset = int(data["offset"])
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if os.pread(fd, len(check), offset - len(check)) != check:
+                return None
+        finally:
+            os.close(fd)
+        event = data["last_listener_event"]
+        return _SpineScan(
+            device=int(data["device"]),
+            inode=int(data["inode"]),
+            offset=offset,
+            check=check,
+            last_downtime=_parse_ts(data["last_downtime"]),
+            last_listener_event=None
+            if event is None
+            else _ListenerEvent(
+                event_type=event["event_type"],
+                timestamp=_parse_ts(event["timestamp"]),
+                event_id=event["event_id"],
+            ),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_spine_scan(path: Path, scan: _SpineScan) -> None:
+    event = scan.last_listener_event
+    state = {
+        "device": scan.device,
+        "inode": scan.inode,
+        "offset": scan.offset,
+        "check": scan.check.hex(),
+        "last_downtime": scan.last_downtime.isoformat() if scan.last_downtime else None,
+        "last_listener_event": None
+        if event is None
+        else {
+            "event_type": event.event_type,
+            "timestamp": event.timestamp.isoformat(),
+            "event_id": event.event_id,
+        },
+    }
+    try:
+        atomic_write_json(_spine_state_path(path), state)
+    except OSError:
+        # the state is only a cache; the next process rescans without it
+        return
+
+
+def _fold_spine_line(
+    line: bytes,
+    last_downtime: Optional[datetime],
+    last_listener_event: Optional[_ListenerEvent],
+) -> tuple[Optional[datetime], Optional[_ListenerEvent]]:
+    """Fold one spine line into the latest downtime and listener event so far."""
+    # parsed from bytes by the spine codec (orjson when installed); malformed
+    # and undecodable lines are skipped
+    try:
+        obj = decode(line)
+    except ValueError:
+        return last_downtime, last_listener_event
+    if not isinstance(obj, dict):
+        return last_downtime, last_listener_event
+    event_type = obj.get("event_type")
+    ts = _parse_ts(obj.get("timestamp"))
+    event_id = obj.get("event_id")
+    if not isinstance(event_type, str) or ts is None or not isinstance(event_id, str):
+        return last_downtime, last_listener_event
+    if event_type == "listener.downtime":
+        if last_downtime is None or ts > last_downtime:
+            last_downtime = ts
+    if event_type in {"listener.start", "listener.stop", "listener.crash"}:
+        if last_listener_event is None or ts > last_listener_event.timestamp:
+            last_listener_event = _ListenerEvent(event_type=event_type, timestamp=ts, event_id=event_id)
+    return last_downtime, last_listener_event
+
+
 def _scan_spine(path: Path) -> tuple[Optional[datetime], Optional[_ListenerEvent]]:
-    last_downtime = None
-    last_listener_event = None
+    cached = _SPINE_SCANS.get(path)
+    if cached is None:
+        cached = _load_spine_scan(path)
+    if cached is not None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        if (st.st_dev, st.st_ino) == (cached.device, cached.inode) and st.st_size == cached.offset:
+            # nothing appended since the previous poll
+            _SPINE_SCANS[path] = cached
+            return cached.last_downtime, cached.last_listener_event
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    obj = json.loads(raw)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(obj, dict):
-                    continue
-                event_type = obj.get("event_type")
-                ts = _parse_ts(obj.get("timestamp"))
-                event_id = obj.get("event_id")
-                if not isinstance(event_type, str) or ts is None or not isinstance(event_id, str):
-                    continue
-                if event_type == "listener.downtime":
-                    if last_downtime is None or ts > last_downtime:
-                        last_downtime = ts
-                if event_type in {"listener.start", "listener.stop", "listener.crash"}:
-                    if last_listener_event is None or ts > last_listener_event.timestamp:
-                        last_listener_event = _ListenerEvent(event_type=event_type, timestamp=ts, event_id=event_id)
+        with path.open("rb") as handle:
+            st = os.fstat(handle.fileno())
+            scan = cached
+            if scan is None or (scan.device, scan.inode) != (st.st_dev, st.st_ino) or scan.offset > st.st_size:
+                # first poll, or the spine was replaced or truncated: full rescan
+                scan = _SpineScan(device=st.st_dev, inode=st.st_ino, offset=0)
+            else:
+                handle.seek(scan.offset)
+            offset = scan.offset
+            check = scan.check
+            last_downtime = scan.last_downtime
+            last_listener_event = scan.last_listener_event
+            find_watched = _WATCHED_EVENT_RE.finditer
+            carry = b""
+            while True:
+                block = handle.read(_SCAN_BLOCK_BYTES)
+                data = carry + block
+                # complete lines only; at EOF a final line without its newline
+                # may still be mid-append: it is parsed but re-read next poll
+                # (the maxima are idempotent)
+                end = data.rfind(b"\n") + 1 if block else len(data)
+                line_end = 0
+                for match in find_watched(data, 0, end):
+                    if match.start() < line_end:
+                        continue  # another match on a line already folded
+                    line_start = data.rfind(b"\n", 0, match.start()) + 1
+                    line_end = data.find(b"\n", match.end(), end)
+                    if line_end < 0:
+                        line_end = end
+                    last_downtime, last_listener_event = _fold_spine_line(
+                        data[line_start:line_end], last_downtime, last_listener_event
+                    )
+                if not block:
+                    break
+                if end:
+                    offset += end
+                    check = data[max(0, end - _STATE_CHECK_BYTES) : end]
+                carry = data[end:]
     except OSError:
         return None, None
+    scan = _SpineScan(
+        device=scan.device,
+        inode=scan.inode,
+        offset=offset,
+        check=check,
+        last_downtime=last_downtime,
+        last_listener_event=last_listener_event,
+    )
+    _SPINE_SCANS[path] = scan
+    if scan != cached:
+        _save_spine_scan(path, scan)
     return last_downtime, last_listener_event
 
 
@@ -119,11 +334,11 @@ def _emit_downtime(event_spine: Path, payload: dict) -> None:
         timestamp=_utc_now().isoformat(),
         source="synthdesk_watchdog",
         version=VERSION,
-        host=socket.gethostname(),
+        host=_HOSTNAME,
         payload=payload,
     )
     try:
-        event_spine.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(event_spine.parent)
         append_event_spine(event_spine, event)
     except OSError:
         return
@@ -147,6 +362,10 @@ def _should_emit_downtime(
 
 def run_once(event_spine: Path, runs_dir: Path, gap_seconds: int, poll_interval: float) -> bool:
     last_heartbeat, heartbeat_path, heartbeat_files = _find_latest_heartbeat(runs_dir)
+    if last_heartbeat is not None and (_utc_now() - last_heartbeat).total_seconds() <= gap_seconds:
+        # last_seen is at least the last heartbeat, so a fresh heartbeat alone
+        # rules out downtime: the healthy poll never touches the spine
+        return False
     last_downtime, last_listener_event = _scan_spine(event_spine)
 
     last_seen = last_heartbeat
@@ -198,8 +417,15 @@ def run(
         emitted = run_once(event_spine, runs_dir, gap_seconds, poll)
         return 0 if emitted else 1
 
+    # polls follow a fixed monotonic schedule so run_once time does not
+    # accumulate as drift; slots missed by a slow poll are skipped
+    next_poll = time.monotonic()
     while True:
-        time.sleep(poll)
+        next_poll += poll
+        now_mono = time.monotonic()
+        if now_mono >= next_poll:
+            next_poll += ((now_mono - next_poll) // poll + 1) * poll
+        time.sleep(next_poll - now_mono)
         run_once(event_spine, runs_dir, gap_seconds, poll)
 
 
@@ -9,15 +9,19 @@ REQUIRED = {
 
 path = sys.argv[1]
 
+fields = tuple(REQUIRED.items())
+
 with open(path) as f:
     for i, line in enumerate(f, 1):
         row = json.loads(line)
 
-        for k, t in REQUIRED.items():
-            if k not in row:
-                raise AssertionError(f"line {i}: missing field {k}")
-            if not isinstance(row[k], t):
+        for k, t in fields:
+            # one dict lookup per field; a missing key (or a non-object row) is rare
+            try:
+                value = row[k]
+            except (KeyError, TypeError):
+                raise AssertionError(f"line {i}: missing field {k}") from None
+            if not isinstance(value, t):
                 raise AssertionError(
-                    f"line {i}: field {k} has type {type(row[k])}"
+                    f"line {i}: field {k} has type {type(value)}"
                 )
-
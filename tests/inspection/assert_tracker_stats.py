@@ -0,0 +1,49 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from synthdesk.listener.price_listener import PriceTracker
+from synthdesk.listener.transforms import log_returns, rolling_mean, rolling_std
+
+# PriceTracker keeps O(1) running sums; they must track the direct two-pass
+# statistics, including on a trending, low-noise series (mean >> spread) and
+# after a regime change collapses the window's spread.
+#
+# Tolerance: relative to each statistic, plus an absolute floor at the returns' own scale
+# for means that cancel to ~0.
+RTOL = 1e-8
+ATOL_SCALE = 1e-14
+
+
+def series(seed, n):
+    rnd = random.Random(seed)
+    p = 100.0
+    for i in range(n):
+        if i < n // 2:
+            p *= math.exp(1e-3 + rnd.gauss(0, 1e-8))
+        else:
+            p *= math.exp(rnd.choice((2e-3, -1e-3, 0.0)) + rnd.gauss(0, 1e-9))
+        yield p
+
+
+for window in (3, 5, 60, 200):
+    tracker = PriceTracker("X", window)
+    history = []
+    for i, price in enumerate(series(window, 2000), 1):
+        metrics = tracker.update(price)
+        history.append(price)
+        returns = log_returns(history[-window:], window - 1)
+        expected = {
+            "rolling_mean": rolling_mean(returns, len(returns)) if returns else 0.0,
+            "rolling_std": rolling_std(returns, len(returns)) if returns else 0.0,
+        }
+        scale = max((abs(r) for r in returns), default=0.0)
+        for k, want in expected.items():
+            got = metrics[k]
+            if abs(got - want) > RTOL * abs(want) + ATOL_SCALE * scale:
+                raise AssertionError(
+                    f"window {window} tick {i}: {k} {got!r} != {want!r}"
+                )